@@ -1,13 +1,115 @@
+import asyncio
+import json
+import os
+import re
+import time
+from typing import Any, Callable, Optional
+
+import aiohttp
 import appdirs
+import diskcache
 import requests_cache
 
+CACHE_DIR = appdirs.user_cache_dir("licesenser", "bcx")  # change with app name
+CACHE_EXPIRE_AFTER = requests_cache.timedelta(days=7)
+CACHEABLE_CODES = (200, 400)
+
 session = requests_cache.CachedSession(
-    appdirs.user_cache_dir("licesenser", "bcx"),  # change with app name
+    CACHE_DIR,
     use_cache_dir=True,
     cache_control=True,
-    expire_after=requests_cache.timedelta(days=7),
-    allowable_codes=[200, 400],
+    expire_after=CACHE_EXPIRE_AFTER,
+    allowable_codes=list(CACHEABLE_CODES),
     allowable_methods=["GET"],
     match_headers=["Accept-Language"],
     stale_if_error=True,
 )
+
+MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class AsyncPyPIClient:
+    """Asyncio client for the PyPI JSON API.
+
+    One pooled `aiohttp` session keeps connections to pypi.org alive, at most
+    `max_in_flight` requests are sent at once, and responses are cached on disk
+    with the same rules as `session`: GET responses with a cacheable status code
+    are kept for `CACHE_EXPIRE_AFTER` unless their Cache-Control header says
+    otherwise, and a stale response is served when the request fails.
+    """
+
+    def __init__(
+        self: "AsyncPyPIClient",
+        max_in_flight: int = 20,
+        timeout: float = 60,
+        cache_dir: str = os.path.join(CACHE_DIR, "async"),
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.cache = diskcache.Cache(cache_dir)
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self: "AsyncPyPIClient") -> "AsyncPyPIClient":
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_in_flight),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self: "AsyncPyPIClient", *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self: "AsyncPyPIClient") -> None:
+        """Close the pooled connections and the on-disk cache."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self.cache.close()
+
+    async def get_json(
+        self: "AsyncPyPIClient",
+        url: str,
+        object_pairs_hook: Optional[Callable[[list[tuple[str, Any]]], Any]] = None,
+    ) -> Any:
+        """Return the decoded JSON body of a GET request to `url`.
+
+        :param str url: url to fetch
+        :param Callable object_pairs_hook: hook building JSON objects, see `json.loads`
+        :raises aiohttp.ClientError: if the request fails and nothing is cached
+        :raises ValueError: if the body is not valid JSON
+        :return Any: decoded response body
+        """
+        cached = self.cache.get(url)
+        if cached is not None and cached[0] > time.time():
+            return json.loads(cached[1], object_pairs_hook=object_pairs_hook)
+        if self._session is None:
+            raise RuntimeError(
+                "AsyncPyPIClient must be used as an async context manager"
+            )
+
+        try:
+            async with self._semaphore:
+                async with self._session.get(url) as response:
+                    status = response.status
+                    cache_control = response.headers.get("Cache-Control", "")
+                    body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if cached is not None:  # stale if error
+                return json.loads(cached[1], object_pairs_hook=object_pairs_hook)
+            raise
+
+        if status in CACHEABLE_CODES and "no-store" not in cache_control:
+            max_age = MAX_AGE.search(cache_control)
+            ttl = (
+                int(max_age.group(1)) if max_age else CACHE_EXPIRE_AFTER.total_seconds()
+            )
+            # keep the entry past its expiry so it can still be served on errors
+            self.cache.set(
+                url,
+                (time.time() + ttl, body),
+                expire=ttl + CACHE_EXPIRE_AFTER.total_seconds(),
+            )
+        return json.loads(body, object_pairs_hook=object_pairs_hook)
@@ -1,7 +1,48 @@
 from abc import ABC, abstractmethod
+from typing import NamedTuple
 
 
 class DependencyReader(ABC):
     @abstractmethod
     def read_dependencies(self: "DependencyReader", file_path: str) -> set[str]:  # type: ignore
         pass
+
+    def source_files(self: "DependencyReader", file_path: str) -> list[str]:
+        """Return the files the dependencies of a manifest are read from.
+
+        Args:
+            file_path (str): The path to the manifest.
+
+        Returns:
+            list[str]: The manifest and the files it includes.
+        """
+        return [file_path]
+
+
+class LockedDependency(NamedTuple):
+    name: str
+    version: str
+    hashes: tuple[str, ...]
+
+
+class LockfileReader(DependencyReader):
+    @abstractmethod
+    def read_locked_dependencies(
+        self: "LockfileReader", file_path: str
+    ) -> list[LockedDependency]:  # type: ignore
+        pass
+
+    def read_dependencies(self: "LockfileReader", file_path: str) -> set[str]:
+        """Read the locked dependencies of a lockfile.
+
+        Args:
+            file_path (str): The path to the lockfile.
+
+        Returns:
+            set[str]: A set of dependencies in the format 'package_name=version',
+            with the exact resolved versions.
+        """
+        return {
+            f"{dependency.name}={dependency.version}"
+            for dependency in self.read_locked_dependencies(file_path)
+        }
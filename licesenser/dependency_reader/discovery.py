@@ -0,0 +1,214 @@
+import fnmatch
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Union
+
+from licesenser.license_manager.get_project_license import (
+    FileFinder, exclude_directories)
+from licesenser.schemas import canonicalize_name
+
+from .dependency import DependencyReader
+from .manifest_cache import ManifestCache, manifest_cache
+from .pep508 import Environment
+from .pipfile import PipfileReader
+from .pipfile_lock import PipfileLockReader
+from .poetry_lock import PoetryLockReader
+from .poetry_toml import PyprojectTomlReader
+from .requirements_txt import RequirementsTxtReader
+
+# supported dependency manifests, by lowercase file name
+MANIFEST_READERS: dict[str, Callable[[Optional[Environment]], DependencyReader]] = {
+    "pipfile": PipfileReader,
+    "pipfile.lock": PipfileLockReader,
+    "poetry.lock": PoetryLockReader,
+    "pyproject.toml": PyprojectTomlReader,
+    "requirements.txt": RequirementsTxtReader,
+}
+
+# requirements files go by many names, e.g. requirements-dev.txt,
+# dev-requirements.txt or requirements/base.txt
+REQUIREMENTS_PATTERNS = (
+    "requirements*.txt",
+    "*-requirements.txt",
+    "*_requirements.txt",
+)
+REQUIREMENTS_DIRECTORY = "requirements"
+
+# manifests superseded by the lockfile next to them
+LOCKFILES = {
+    "pipfile": "pipfile.lock",
+    "pyproject.toml": "poetry.lock",
+}
+
+
+def get_manifest_kind(file_path: str) -> Optional[str]:
+    """Return the kind of a dependency manifest, based on its path.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        str | None: The lowercase file name the manifest is read as, a key of
+        `MANIFEST_READERS`, or None if the file is not a supported manifest.
+    """
+    name = os.path.basename(file_path).lower()
+    if name in MANIFEST_READERS:
+        return name
+    if any(fnmatch.fnmatchcase(name, pattern) for pattern in REQUIREMENTS_PATTERNS):
+        return "requirements.txt"
+    directory = os.path.basename(os.path.dirname(file_path)).lower()
+    if directory == REQUIREMENTS_DIRECTORY and name.endswith(".txt"):
+        return "requirements.txt"
+    return None
+
+
+class ManifestFinder(FileFinder):
+    """Find the files `get_manifest_kind` recognizes as dependency manifests."""
+
+    def is_target(self: "ManifestFinder", directory: str, name: str) -> bool:
+        return super().is_target(directory, name) or (
+            get_manifest_kind(os.path.join(directory, name)) is not None
+        )
+
+
+def get_manifest_reader(
+    file_path: str, environment: Optional[Environment] = None
+) -> DependencyReader:
+    """Return the reader of a dependency manifest, see `get_manifest_kind`.
+
+    Args:
+        file_path (str): The path to the manifest.
+        environment (Environment): The marker variables the reader evaluates
+            environment markers with, those of the running interpreter by
+            default.
+
+    Returns:
+        DependencyReader: The reader for this kind of manifest.
+    """
+    kind = get_manifest_kind(file_path)
+    if kind is None:
+        raise ValueError(f"Unsupported dependency manifest {file_path}")
+    return MANIFEST_READERS[kind](environment)
+
+
+def find_manifests(
+    root_dir: str, prefer_lockfiles: bool = True, follow_symlinks: bool = False
+) -> list[str]:
+    """Find the dependency manifests of a project.
+
+    Args:
+        root_dir (str): The project directory, searched recursively.
+        prefer_lockfiles (bool): Skip a Pipfile or pyproject.toml when the
+            lockfile of its directory was found as well.
+        follow_symlinks (bool): Follow symlinked directories.
+
+    Returns:
+        list[str]: The paths of the manifests.
+    """
+    file_finder = ManifestFinder(MANIFEST_READERS, exclude_directories, follow_symlinks)
+    manifests = []
+    for _, found_files in file_finder.walk(root_dir):
+        names = {os.path.basename(file_path).lower() for file_path in found_files}
+        for file_path in found_files:
+            name = os.path.basename(file_path).lower()
+            if prefer_lockfiles and LOCKFILES.get(name) in names:
+                continue
+            manifests.append(file_path)
+    return manifests
+
+
+def read_manifest(
+    file_path: str,
+    cache: Optional[ManifestCache] = None,
+    environment: Optional[Environment] = None,
+) -> set[str]:
+    """Read the dependencies of a manifest, logging the error and returning
+    no dependencies when it cannot be read.
+
+    Args:
+        file_path (str): The path to the manifest.
+        cache (ManifestCache): Cache of parsed manifests, looked up by the
+            content hash of the manifest and of the files it includes before
+            parsing.
+        environment (Environment): The marker variables environment markers
+            are evaluated with, those of the running interpreter by default.
+
+    Returns:
+        set[str]: The dependencies in the format 'package_name=version'.
+    """
+    name = os.path.basename(file_path)
+    try:
+        reader = get_manifest_reader(file_path, environment)
+        digest = None
+        if cache is not None:
+            sha256 = hashlib.sha256()
+            for source_file in reader.source_files(file_path):
+                with open(source_file, "rb") as file:
+                    sha256.update(hashlib.sha256(file.read()).digest())
+            digest = sha256.hexdigest()
+            dependencies = cache.get(name, digest, environment)
+            if dependencies is not None:
+                return dependencies
+        dependencies = reader.read_dependencies(file_path)
+        if cache is not None and digest is not None:
+            cache.set(name, digest, dependencies, environment)
+        return dependencies
+    except Exception as e:
+        logging.error(f"Error reading file {file_path}: {e}")
+        return set()
+
+
+def discover_dependencies(
+    roots: Union[str, Iterable[str]],
+    max_workers: int = 8,
+    prefer_lockfiles: bool = True,
+    use_cache: bool = True,
+    environment: Optional[Environment] = None,
+) -> dict[str, set[str]]:
+    """Find and read the dependency manifests of one or many projects.
+
+    Manifests are read in a thread pool, so that their file I/O overlaps;
+    parsing itself holds the GIL and does not run in parallel. Their
+    dependencies are merged, each one being listed once however many manifests
+    declare it, in any spelling.
+
+    Args:
+        roots (str | Iterable[str]): The project directories.
+        max_workers (int): The number of manifests read concurrently.
+        prefer_lockfiles (bool): Read the exact versions of a lockfile rather
+            than the constraints of the manifest next to it.
+        use_cache (bool): Read and store parsed manifests in the persistent
+            `manifest_cache`.
+        environment (Environment): The marker variables of the target
+            environment, those of the running interpreter by default.
+            Dependencies whose marker does not hold there are left out.
+
+    Returns:
+        dict[str, set[str]]: The dependencies in the format
+        'package_name=version', with the paths of the manifests declaring them.
+        Package names are PEP 503 normalized, so that spellings of one
+        package from different manifests are merged.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if isinstance(roots, str):
+        roots = [roots]
+    manifests: list[str] = []
+    for root_dir in roots:
+        manifests.extend(find_manifests(root_dir, prefer_lockfiles))
+
+    cache = manifest_cache if use_cache else None
+
+    def read(file_path: str) -> set[str]:
+        return read_manifest(file_path, cache, environment)
+
+    dependencies: dict[str, set[str]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for file_path, found in zip(manifests, pool.map(read, manifests)):
+            for dependency in found:
+                name, _, version = dependency.partition("=")
+                dependency = f"{canonicalize_name(name)}={version}"
+                dependencies.setdefault(dependency, set()).add(file_path)
+    return dependencies
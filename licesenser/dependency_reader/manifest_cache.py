@@ -0,0 +1,106 @@
+import hashlib
+import os
+import zlib
+from typing import Optional
+
+import diskcache
+
+from licesenser.connections import CACHE_DIR
+
+from .pep508 import DEFAULT_ENVIRONMENT, Environment
+
+MANIFEST_CACHE_SIZE_LIMIT = 2**24  # 16 MiB
+# bump when a reader changes what it returns, to drop stale entries
+MANIFEST_CACHE_VERSION = 2
+
+
+def environment_tag(environment: Optional[Environment] = None) -> str:
+    """Return a short hash of the environment markers are evaluated in, which
+    parsed dependencies depend on.
+
+    Args:
+        environment (Environment): The marker variables, those of the running
+            interpreter by default.
+
+    Returns:
+        str: The hex digest of the environment.
+    """
+    if environment is None:
+        environment = DEFAULT_ENVIRONMENT
+    text = repr(sorted(environment.items()))
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+class ManifestCache:
+    """Persistent cache of parsed dependency manifests.
+
+    Entries are keyed by the kind of manifest, the SHA-256 hash of its content
+    and the environment markers are evaluated in, so an unchanged manifest is
+    parsed once, wherever it is. The dependencies are stored sorted, newline
+    separated and zlib compressed, and the least recently used entries are
+    evicted once the cache grows past `size_limit` bytes.
+    """
+
+    def __init__(
+        self: "ManifestCache",
+        directory: str = os.path.join(CACHE_DIR, "manifests"),
+        size_limit: int = MANIFEST_CACHE_SIZE_LIMIT,
+    ) -> None:
+        self.cache = diskcache.Cache(
+            directory,
+            size_limit=size_limit,
+            eviction_policy="least-recently-used",
+        )
+
+    @staticmethod
+    def key(name: str, digest: str, environment: Optional[Environment] = None) -> str:
+        """Return the cache key of a manifest content."""
+        tag = environment_tag(environment)
+        return f"{MANIFEST_CACHE_VERSION}:{tag}:{name.lower()}:{digest}"
+
+    def get(
+        self: "ManifestCache",
+        name: str,
+        digest: str,
+        environment: Optional[Environment] = None,
+    ) -> Optional[set[str]]:
+        """Return the dependencies of a manifest content, if it was parsed
+        before.
+
+        Args:
+            name (str): The file name of the manifest, e.g. `Pipfile`.
+            digest (str): The SHA-256 hash of its content.
+            environment (Environment): The marker variables the manifest was
+                read with, those of the running interpreter by default.
+
+        Returns:
+            set[str] | None: The dependencies in the format 'package_name=version'.
+        """
+        data = self.cache.get(self.key(name, digest, environment))
+        if data is None:
+            return None
+        text = zlib.decompress(data).decode()
+        return set(text.split("\n")) if text else set()
+
+    def set(
+        self: "ManifestCache",
+        name: str,
+        digest: str,
+        dependencies: set[str],
+        environment: Optional[Environment] = None,
+    ) -> None:
+        """Store the dependencies of a manifest content, read with the marker
+        variables `environment`."""
+        data = zlib.compress("\n".join(sorted(dependencies)).encode())
+        self.cache.set(self.key(name, digest, environment), data)
+
+    def clear(self: "ManifestCache") -> int:
+        """Remove every entry and return how many were removed."""
+        return self.cache.clear()
+
+    def close(self: "ManifestCache") -> None:
+        """Close the underlying database."""
+        self.cache.close()
+
+
+manifest_cache = ManifestCache()
@@ -0,0 +1,465 @@
+import logging
+import os
+import platform
+import re
+import shlex
+import sys
+from functools import lru_cache
+from typing import Any, Mapping, NamedTuple, Optional, Union
+
+from licesenser.schemas import canonicalize_name
+
+VERSION_CLAUSE = r"(?:===|==|!=|<=|>=|~=|<|>)\s*[^,;()\s<>=!~][^,;()\s]*"
+REQUIREMENT = re.compile(
+    rf"""^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*
+    (?:\[(?P<extras>[^\]]*)\])?\s*
+    (?:@\s*(?P<url>[^\s;]+)\s*
+    |\(?\s*(?P<specifier>{VERSION_CLAUSE}(?:\s*,\s*{VERSION_CLAUSE})*)?\s*\)?\s*)
+    (?:;\s*(?P<marker>.*?))?\s*$""",
+    re.VERBOSE,
+)
+PINNED = re.compile(r"^===?\s*([^,\s*]+)$")
+MARKER_TOKEN = re.compile(
+    r"""\s*(?:
+    (?P<string>'[^']*'|"[^"]*")
+    |(?P<op>===|==|!=|<=|>=|~=|<|>|not\s+in\b|in\b)
+    |(?P<bool>and\b|or\b)
+    |(?P<paren>[()])
+    |(?P<variable>[a-z_]+)
+    )""",
+    re.VERBOSE,
+)
+VERSION = re.compile(r"^\s*v?(\d+(?:\.\d+)*)(\.\*)?")
+VERSION_VARIABLES = frozenset(
+    {"python_version", "python_full_version", "implementation_version"}
+)
+
+# parsed markers are nested tuples, see `parse_marker`
+Marker = tuple
+Environment = Mapping[str, str]
+
+
+class Requirement(NamedTuple):
+    name: str
+    extras: frozenset[str]
+    specifier: str  # e.g. `>=2.0,<3`, empty when any version goes
+    url: Optional[str]
+    marker: Optional[str]
+
+    @property
+    def version(self: "Requirement") -> str:
+        """Return the version in the format of the dependency readers: the
+        pinned version, otherwise the specifier, or `*`."""
+        pinned = PINNED.match(self.specifier)
+        if pinned:
+            return pinned.group(1)
+        return self.specifier or "*"
+
+    def to_dependency(self: "Requirement") -> str:
+        """Return the requirement in the format 'package_name=version'."""
+        return f"{self.name}={self.version}"
+
+
+class RequirementLine(NamedTuple):
+    requirement: Requirement
+    hashes: tuple[str, ...]
+    source: str  # file the requirement was read from
+
+
+def default_environment() -> dict[str, str]:
+    """Return the marker environment of the running interpreter, see PEP 508."""
+    implementation = sys.implementation
+    info = implementation.version
+    implementation_version = f"{info.major}.{info.minor}.{info.micro}"
+    if info.releaselevel != "final":
+        implementation_version += f"{info.releaselevel[0]}{info.serial}"
+    return {
+        "implementation_name": implementation.name,
+        "implementation_version": implementation_version,
+        "os_name": os.name,
+        "platform_machine": platform.machine(),
+        "platform_python_implementation": platform.python_implementation(),
+        "platform_release": platform.release(),
+        "platform_system": platform.system(),
+        "platform_version": platform.version(),
+        "python_full_version": platform.python_version(),
+        "python_version": ".".join(platform.python_version_tuple()[:2]),
+        "sys_platform": sys.platform,
+        "extra": "",
+    }
+
+
+@lru_cache(maxsize=4096)
+def parse_requirement(line: str) -> Requirement:
+    """Parse a PEP 508 requirement, e.g. `requests[socks]>=2.8; python_version > "3"`.
+
+    Args:
+        line (str): The requirement.
+
+    Returns:
+        Requirement: The parsed requirement.
+
+    Raises:
+        ValueError: If the line is not a requirement.
+    """
+    match = REQUIREMENT.match(line)
+    if match is None:
+        raise ValueError(f"Invalid requirement {line!r}")
+    extras = match.group("extras")
+    return Requirement(
+        match.group("name"),
+        frozenset(canonicalize_name(e.strip()) for e in extras.split(",") if e.strip())
+        if extras
+        else frozenset(),
+        re.sub(r"\s+", "", match.group("specifier") or ""),
+        match.group("url"),
+        match.group("marker") or None,
+    )
+
+
+@lru_cache(maxsize=1024)
+def parse_marker(marker: str) -> Marker:
+    """Parse an environment marker into nested `("or", ...)`, `("and", ...)`
+    and `(left, op, right)` tuples, operands being `("variable", name)` or
+    `("string", value)`.
+
+    Args:
+        marker (str): The marker, e.g. `python_version >= "3.8" and os_name == "posix"`.
+
+    Returns:
+        Marker: The parsed marker.
+
+    Raises:
+        ValueError: If the marker is malformed.
+    """
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    marker = marker.strip()
+    while position < len(marker):
+        match = MARKER_TOKEN.match(marker, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid marker {marker!r}")
+        kind = match.lastgroup or ""
+        value = match.group(kind)
+        tokens.append((kind, value[1:-1] if kind == "string" else value))
+        position = match.end()
+
+    def parse_or(index: int) -> tuple[Marker, int]:
+        return parse_chain(index, "or", parse_and)
+
+    def parse_and(index: int) -> tuple[Marker, int]:
+        return parse_chain(index, "and", parse_comparison)
+
+    def parse_chain(
+        index: int, operator: str, parse_operand: Any
+    ) -> tuple[Marker, int]:
+        node, index = parse_operand(index)
+        nodes = [node]
+        while index < len(tokens) and tokens[index] == ("bool", operator):
+            node, index = parse_operand(index + 1)
+            nodes.append(node)
+        return (nodes[0] if len(nodes) == 1 else (operator, *nodes)), index
+
+    def parse_comparison(index: int) -> tuple[Marker, int]:
+        if index < len(tokens) and tokens[index] == ("paren", "("):
+            node, index = parse_or(index + 1)
+            if index >= len(tokens) or tokens[index] != ("paren", ")"):
+                raise ValueError(f"Invalid marker {marker!r}")
+            return node, index + 1
+        if index + 3 > len(tokens):
+            raise ValueError(f"Invalid marker {marker!r}")
+        left, op, right = tokens[index : index + 3]
+        operands = ("variable", "string")
+        if left[0] not in operands or op[0] != "op" or right[0] not in operands:
+            raise ValueError(f"Invalid marker {marker!r}")
+        return (left, " ".join(op[1].split()), right), index + 3
+
+    node, index = parse_or(0)
+    if index != len(tokens):
+        raise ValueError(f"Invalid marker {marker!r}")
+    return node
+
+
+def parse_version(version: str) -> Optional[tuple[tuple[int, ...], bool]]:
+    """Return the release segment of a version and whether it ends in `.*`."""
+    match = VERSION.match(version)
+    if match is None:
+        return None
+    return tuple(int(part) for part in match.group(1).split(".")), bool(match.group(2))
+
+
+def compare_versions(left: str, op: str, right: str) -> Optional[bool]:
+    """Compare the release segments of two versions, None if they are not
+    versions."""
+    parsed_left, parsed_right = parse_version(left), parse_version(right)
+    if parsed_left is None or parsed_right is None:
+        return None
+    release, (other, wildcard) = parsed_left[0], parsed_right
+    if wildcard and op in ("==", "!="):
+        matches = release[: len(other)] == other
+        return matches if op == "==" else not matches
+    width = max(len(release), len(other))
+    release += (0,) * (width - len(release))
+    padded = other + (0,) * (width - len(other))
+    if op == "~=":
+        return release >= padded and release[: len(other) - 1] == other[:-1]
+    return {
+        "==": release == padded,
+        "===": left == right,
+        "!=": release != padded,
+        "<": release < padded,
+        "<=": release <= padded,
+        ">": release > padded,
+        ">=": release >= padded,
+    }.get(op)
+
+
+def evaluate_node(node: Marker, environment: Environment) -> bool:
+    """Evaluate a parsed marker, see `parse_marker`."""
+    if node[0] in ("and", "or"):
+        results = (evaluate_node(child, environment) for child in node[1:])
+        return all(results) if node[0] == "and" else any(results)
+
+    (left_kind, left), op, (right_kind, right) = node
+    variables = set()
+    if left_kind == "variable":
+        variables.add(left)
+        left = environment.get(left, "")
+    if right_kind == "variable":
+        variables.add(right)
+        right = environment.get(right, "")
+    if "extra" in variables:
+        left, right = canonicalize_name(left), canonicalize_name(right)
+    if op == "in":
+        return left in right
+    if op == "not in":
+        return left not in right
+    if variables & VERSION_VARIABLES or op not in ("==", "!="):
+        result = compare_versions(left, op, right)
+        if result is not None:
+            return result
+    if op == "==":
+        return left == right
+    if op == "!=":
+        return left != right
+    return False
+
+
+def evaluate_marker(marker: str, environment: Optional[Environment] = None) -> bool:
+    """Tell whether an environment marker holds.
+
+    Malformed markers are logged and hold, so that the requirement is kept.
+
+    Args:
+        marker (str): The environment marker.
+        environment (Environment): The marker variables, those of the running
+            interpreter by default.
+
+    Returns:
+        bool: Whether the marker holds in the environment.
+    """
+    if environment is None:
+        environment = DEFAULT_ENVIRONMENT
+    try:
+        return evaluate_node(parse_marker(marker), environment)
+    except ValueError as e:
+        logging.warning(f"Ignoring marker: {e}")
+        return True
+
+
+def is_required(
+    requirement: Requirement, environment: Optional[Environment] = None
+) -> bool:
+    """Tell whether a requirement applies to an environment."""
+    return requirement.marker is None or evaluate_marker(
+        requirement.marker, environment
+    )
+
+
+OPTION = re.compile(r"^(-[a-zA-Z]|--[a-z-]+)(?:[=\s]\s*(.*))?$")
+INCLUDE_OPTIONS = {"-r": "requirement", "--requirement": "requirement"}
+INCLUDE_OPTIONS.update({"-c": "constraint", "--constraint": "constraint"})
+
+
+class RequirementsFile(NamedTuple):
+    lines: tuple[RequirementLine, ...]
+    # position among `lines`, kind and path of each -r/-c
+    includes: tuple[tuple[int, str, str], ...]
+
+
+def logical_lines(text: str) -> list[str]:
+    """Join continuation lines and drop comments."""
+    lines = []
+    current = ""
+    for line in text.splitlines():
+        if line.endswith("\\"):
+            current += line[:-1] + " "
+            continue
+        line = current + line
+        current = ""
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if line:
+            lines.append(line)
+    if current.strip():
+        lines.append(current.strip())
+    return lines
+
+
+@lru_cache(maxsize=256)
+def parse_requirements_file(
+    file_path: str, mtime_ns: int, size: int
+) -> RequirementsFile:
+    """Parse a requirements file, without following its includes.
+
+    Parsed files are memoized by path, modification time and size, so that a
+    file included by many others is parsed once.
+
+    Args:
+        file_path (str): The absolute path to the file.
+        mtime_ns (int): The modification time of the file.
+        size (int): The size of the file, in bytes.
+
+    Returns:
+        RequirementsFile: The requirements and includes, in file order.
+    """
+    with open(file_path, "r") as file:
+        text = file.read()
+    lines = []
+    includes = []
+    for line in logical_lines(text):
+        hashes = tuple(re.findall(r"--hash[=\s]\s*(\S+)", line))
+        line = re.sub(r"\s--hash[=\s]\s*\S+", "", line).strip()
+        if line.startswith("-"):
+            option = OPTION.match(line)
+            if option and option.group(1) in INCLUDE_OPTIONS and option.group(2):
+                include = shlex.split(option.group(2))[0]
+                path = os.path.join(os.path.dirname(file_path), include)
+                includes.append((len(lines), INCLUDE_OPTIONS[option.group(1)], path))
+            # other options, editable installs included, name no requirement
+            continue
+        try:
+            requirement = parse_requirement(line)
+        except ValueError:
+            logging.warning(f"Skipping {line!r} in {file_path}")
+            continue
+        lines.append(RequirementLine(requirement, hashes, file_path))
+    return RequirementsFile(tuple(lines), tuple(includes))
+
+
+def read_requirements_file(
+    file_path: str, environment: Optional[Environment] = None
+) -> list[RequirementLine]:
+    """Read a requirements file and the files it includes, recursively.
+
+    Requirements of `-r` files are added, while `-c` constraint files only pin
+    the version of requirements found elsewhere. Requirements whose marker
+    does not hold in the environment are dropped.
+
+    Args:
+        file_path (str): The path to the requirements file.
+        environment (Environment): The marker variables, those of the running
+            interpreter by default.
+
+    Returns:
+        list[RequirementLine]: The requirements, in file order.
+    """
+    requirements: list[RequirementLine] = []
+    constraints: dict[str, Requirement] = {}
+    visited: set[str] = set()
+
+    def read(path: str, kind: str) -> None:
+        path = os.path.abspath(path)
+        if path in visited:
+            return
+        visited.add(path)
+        stat = os.stat(path)
+        parsed = parse_requirements_file(path, stat.st_mtime_ns, stat.st_size)
+        includes = iter(parsed.includes)
+        include = next(includes, None)
+        for position in range(len(parsed.lines) + 1):
+            while include is not None and include[0] == position:
+                _, include_kind, include_path = include
+                read(
+                    include_path, "constraint" if kind == "constraint" else include_kind
+                )
+                include = next(includes, None)
+            if position == len(parsed.lines):
+                break
+            line = parsed.lines[position]
+            if not is_required(line.requirement, environment):
+                continue
+            if kind == "constraint":
+                constraints.setdefault(
+                    canonicalize_name(line.requirement.name), line.requirement
+                )
+            else:
+                requirements.append(line)
+
+    read(file_path, "requirement")
+    return [apply_constraint(line, constraints) for line in requirements]
+
+
+def find_requirements_files(file_path: str) -> list[str]:
+    """Return a requirements file and the files it includes, recursively.
+
+    Args:
+        file_path (str): The path to the requirements file.
+
+    Returns:
+        list[str]: The absolute paths of the files, in the order they are read.
+    """
+    paths: list[str] = []
+
+    def find(path: str) -> None:
+        path = os.path.abspath(path)
+        if path in paths:
+            return
+        paths.append(path)
+        stat = os.stat(path)
+        parsed = parse_requirements_file(path, stat.st_mtime_ns, stat.st_size)
+        for _, _, include in parsed.includes:
+            find(include)
+
+    find(file_path)
+    return paths
+
+
+def apply_constraint(
+    line: RequirementLine, constraints: dict[str, Requirement]
+) -> RequirementLine:
+    """Pin a requirement to the version of its constraint."""
+    constraint = constraints.get(canonicalize_name(line.requirement.name))
+    if constraint is None or not PINNED.match(constraint.specifier):
+        return line
+    return line._replace(
+        requirement=line.requirement._replace(specifier=constraint.specifier)
+    )
+
+
+def format_dependency(
+    name: str, spec: Union[str, Mapping], environment: Optional[Environment] = None
+) -> Optional[str]:
+    """Format a Pipfile or Poetry dependency table entry as 'package_name=version'.
+
+    Args:
+        name (str): The package name.
+        spec (str | Mapping): The version constraint, or a table with
+            `version` and `markers` keys.
+        environment (Environment): The marker variables, those of the running
+            interpreter by default.
+
+    Returns:
+        str | None: The dependency, None if it is optional or its marker does
+        not hold.
+    """
+    if isinstance(spec, Mapping):
+        if spec.get("optional"):
+            return None
+        markers = spec.get("markers")
+        if markers and not evaluate_marker(markers, environment):
+            return None
+        spec = spec.get("version", "*")
+    return f"{name}={str(spec).strip('=')}"
+
+
+DEFAULT_ENVIRONMENT = default_environment()
@@ -1,9 +1,17 @@
+from typing import Optional
+
 import toml
 
 from .dependency import DependencyReader
+from .pep508 import Environment, format_dependency
 
 
 class PipfileReader(DependencyReader):
+    def __init__(
+        self: "PipfileReader", environment: Optional[Environment] = None
+    ) -> None:
+        self.environment = environment
+
     def read_dependencies(self: "PipfileReader", file_path: str) -> set[str]:
         """Read dependencies from a Pipfile and return them as a set of strings.
 
@@ -20,8 +28,7 @@ class PipfileReader(DependencyReader):
         package_sections = ["packages", "dev-packages"]
         for section in package_sections:
             for package_name, version in pipfile.get(section, {}).items():
-                if isinstance(version, dict):
-                    version = version.get("version", "*").strip("=")
-                version = str(version).strip("=")
-                dependencies.add(f"{package_name}={version}")
+                dependency = format_dependency(package_name, version, self.environment)
+                if dependency is not None:
+                    dependencies.add(dependency)
         return dependencies
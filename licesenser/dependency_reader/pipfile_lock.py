@@ -0,0 +1,43 @@
+import json
+from typing import Optional
+
+from .dependency import LockedDependency, LockfileReader
+from .pep508 import Environment, evaluate_marker
+
+
+class PipfileLockReader(LockfileReader):
+    def __init__(
+        self: "PipfileLockReader", environment: Optional[Environment] = None
+    ) -> None:
+        self.environment = environment
+
+    def read_locked_dependencies(
+        self: "PipfileLockReader", file_path: str
+    ) -> list[LockedDependency]:
+        """Read every locked package, transitive ones included, from a
+        Pipfile.lock file.
+
+        Args:
+            file_path (str): The path to the Pipfile.lock file.
+
+        Returns:
+            list[LockedDependency]: The name, exact version and hashes of every
+            package whose marker holds in the target environment, the
+            `default` ones first.
+        """
+        with open(file_path, "r") as file:
+            pipfile_lock = json.load(file)
+
+        dependencies: dict[str, LockedDependency] = {}
+        for section in ["default", "develop"]:
+            for package_name, package in pipfile_lock.get(section, {}).items():
+                if package_name in dependencies:
+                    continue
+                markers = package.get("markers")
+                if markers and not evaluate_marker(markers, self.environment):
+                    continue
+                version = package.get("version", "*").lstrip("=")
+                dependencies[package_name] = LockedDependency(
+                    package_name, version, tuple(package.get("hashes", ()))
+                )
+        return list(dependencies.values())
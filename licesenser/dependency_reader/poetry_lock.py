@@ -0,0 +1,83 @@
+import re
+from typing import Optional
+
+from licesenser.schemas import canonicalize_name
+
+from .dependency import LockedDependency, LockfileReader
+from .pep508 import Environment, evaluate_marker
+
+TABLE_HEADER = re.compile(r"^\[\[?\s*([^\]]+?)\s*\]\]?\s*$")
+PACKAGE_FIELD = re.compile(r'^(name|version|markers)\s*=\s*"((?:[^"\\]|\\.)*)"')
+FILES_ENTRY = re.compile(r'^"?([^"=\s]+)"?\s*=\s*\[')
+HASH = re.compile(r'hash\s*=\s*"([^"]+)"')
+
+
+class PoetryLockReader(LockfileReader):
+    def __init__(
+        self: "PoetryLockReader", environment: Optional[Environment] = None
+    ) -> None:
+        self.environment = environment
+
+    def read_locked_dependencies(
+        self: "PoetryLockReader", file_path: str
+    ) -> list[LockedDependency]:
+        """Read every locked package, transitive ones included, from a poetry.lock
+        file.
+
+        The file is scanned once, line by line, for the fields that are needed
+        instead of being loaded as a TOML document. Hashes are read from the
+        `files` of each package, or from the `[metadata.files]` table of older
+        lockfiles.
+
+        Args:
+            file_path (str): The path to the poetry.lock file.
+
+        Returns:
+            list[LockedDependency]: The name, exact version and file hashes of
+            every package whose marker holds in the target environment.
+        """
+        packages: list[dict] = []
+        legacy_hashes: dict[str, list[str]] = {}
+        legacy_name = ""
+        table = ""
+        with open(file_path, "r") as file:
+            for line in file:
+                if line.startswith("["):
+                    match = TABLE_HEADER.match(line)
+                    if match:
+                        table = match.group(1)
+                        if line.startswith("[[") and table == "package":
+                            packages.append({"hashes": []})
+                        continue
+                if table == "package" and packages:
+                    field = PACKAGE_FIELD.match(line)
+                    if field:
+                        value = field.group(2).replace('\\"', '"')
+                        packages[-1][field.group(1)] = value
+                    else:
+                        packages[-1]["hashes"].extend(HASH.findall(line))
+                elif table == "metadata.files":
+                    entry = FILES_ENTRY.match(line)
+                    if entry:
+                        legacy_name = canonicalize_name(entry.group(1))
+                    if legacy_name:
+                        legacy_hashes.setdefault(legacy_name, []).extend(
+                            HASH.findall(line)
+                        )
+
+        return [
+            LockedDependency(
+                package["name"],
+                package.get("version", "*"),
+                tuple(
+                    package["hashes"]
+                    or legacy_hashes.get(canonicalize_name(package["name"]), ())
+                ),
+            )
+            for package in packages
+            if "name" in package
+            and (
+                "markers" not in package
+                or evaluate_marker(package["markers"], self.environment)
+            )
+        ]
@@ -1,11 +1,20 @@
+import logging
+from typing import Optional
+
 import toml
 
 from licesenser.dependency_reader.utils import parse_nested_deps
 
 from .dependency import DependencyReader
+from .pep508 import Environment, is_required, parse_requirement
 
 
 class PyprojectTomlReader(DependencyReader):
+    def __init__(
+        self: "PyprojectTomlReader", environment: Optional[Environment] = None
+    ) -> None:
+        self.environment = environment
+
     def read_dependencies(self: "PyprojectTomlReader", file_path: str) -> set[str]:
         deps = set()
         try:
@@ -15,13 +24,23 @@ class PyprojectTomlReader(DependencyReader):
             with open(file_path, "r") as file:
                 pyproject = toml.load(file)
 
+            for requirement in pyproject.get("project", {}).get("dependencies", []):
+                try:
+                    parsed = parse_requirement(requirement)
+                except ValueError as e:
+                    logging.warning(f"Skipping requirement in {file_path}: {e}")
+                    continue
+                if is_required(parsed, self.environment):
+                    deps.add(parsed.to_dependency())
+
             parse_nested_deps(
                 pyproject.get("tool", {}).get("poetry", {}).get("dependencies", {}),
                 deps,
+                self.environment,
             )
             groups = pyproject.get("tool", {}).get("poetry", {}).get("group", {})
             for group in groups.values():
-                parse_nested_deps(group.get("dependencies", {}), deps)
+                parse_nested_deps(group.get("dependencies", {}), deps, self.environment)
             return deps
         except FileNotFoundError as err:
             raise FileNotFoundError from err
@@ -1,7 +1,43 @@
+from typing import Optional
+
 from .dependency import DependencyReader
+from .pep508 import (Environment, RequirementLine, find_requirements_files,
+                     read_requirements_file)
 
 
 class RequirementsTxtReader(DependencyReader):
+    def __init__(
+        self: "RequirementsTxtReader", environment: Optional[Environment] = None
+    ) -> None:
+        self.environment = environment
+
+    def source_files(self: "RequirementsTxtReader", file_path: str) -> list[str]:
+        """Return a requirements.txt file and the files it includes with `-r`
+        and `-c`, recursively.
+
+        Args:
+            file_path (str): The path to the requirements.txt file.
+
+        Returns:
+            list[str]: The absolute paths of the files.
+        """
+        return find_requirements_files(file_path)
+
+    def read_requirement_lines(
+        self: "RequirementsTxtReader", file_path: str
+    ) -> list[RequirementLine]:
+        """Read the requirements of a requirements.txt file and of the files it
+        includes with `-r` and `-c`, with their hashes.
+
+        Args:
+            file_path (str): The path to the requirements.txt file.
+
+        Returns:
+            list[RequirementLine]: The requirements whose marker holds in the
+            target environment.
+        """
+        return read_requirements_file(file_path, self.environment)
+
     def read_dependencies(self: "RequirementsTxtReader", file_path: str) -> set[str]:
         """Read dependencies from a requirements.txt file and return them as a set of strings.
 
@@ -11,15 +47,7 @@ class RequirementsTxtReader(DependencyReader):
         Returns:
             set[str]: A set of dependencies in the format 'package_name=version'.
         """
-        dependencies = set()
-        with open(file_path, "r") as file:
-            for line in file:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    if "==" in line:
-                        package, version = line.split("==", 1)
-                    else:
-                        package, version = line, "*"
-                    dependencies.add(f"{package.strip()}={version.strip()}")
-
-        return dependencies
+        return {
+            line.requirement.to_dependency()
+            for line in self.read_requirement_lines(file_path)
+        }
@@ -1,5 +1,14 @@
-def parse_nested_deps(input: dict[str, str], output: set[str]) -> None:
+from typing import Optional
+
+from .pep508 import Environment, format_dependency
+
+
+def parse_nested_deps(
+    input: dict[str, str],
+    output: set[str],
+    environment: Optional[Environment] = None,
+) -> None:
     for k, v in input.items():
-        if isinstance(v, dict):
-            v = v.get("version", "*").strip("=")
-        output.add(f"{k}={v}")
+        dependency = format_dependency(k, v, environment)
+        if dependency is not None:
+            output.add(dependency)
@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from typing import Optional
+
+import requests
+
+from licesenser.connections import session
+from licesenser.dependency_reader.pep508 import (Environment, is_required,
+                                                 parse_requirement)
+from licesenser.license_manager.distribution_index import (
+    DistributionIndex, installed_distributions)
+from licesenser.license_manager.get_dependency_license import (
+    get_pypi_url, get_requirements, resolve_package, select_pypi_fields)
+from licesenser.license_manager.package_cache import package_cache
+from licesenser.schemas import (DependencyGraph, PackageInfo,
+                                canonicalize_name, ucstr)
+
+
+def parse_requires_dist(
+    requirement: str, environment: Optional[Environment] = None
+) -> Optional[tuple[ucstr, str]]:
+    """Parse a `Requires-Dist` entry into a package name and version.
+
+    :param str requirement: entry such as `idna<4,>=2.5; python_version >= "3"`
+    :param Environment environment: marker variables of the target
+        environment, those of the running interpreter by default
+    :return tuple[ucstr, str] | None: name and version constraint, None for
+        dependencies whose marker does not hold, such as those only pulled in
+        by an extra
+    """
+    try:
+        parsed = parse_requirement(requirement)
+    except ValueError:
+        return None
+    if not is_required(parsed, environment):
+        return None
+    return ucstr(parsed.name), parsed.version
+
+
+def get_requires_dist_from_local(
+    requirement: ucstr, index: Optional[DistributionIndex] = None
+) -> list[str]:
+    """Get the `Requires-Dist` entries of an installed package.
+
+    :param ucstr requirement: name of the package
+    :param DistributionIndex index: index of the installed distributions
+    :raises ModuleNotFoundError: if the package is not installed
+    :return list[str]: requirement entries
+    """
+    try:
+        if index is not None:
+            distribution = index.get(requirement)
+        else:
+            distribution = metadata.Distribution.from_name(requirement)
+        return distribution.requires or []
+    except metadata.PackageNotFoundError as error:
+        raise ModuleNotFoundError from error
+
+
+def get_requires_dist_from_pypi(
+    requirement: ucstr, version: Optional[str] = None
+) -> list[str]:
+    """Get the `Requires-Dist` entries of a package from PyPI.
+
+    :param ucstr requirement: name of the package
+    :param str version: requested version or constraint
+    :raises ModuleNotFoundError: if the package could not be fetched
+    :return list[str]: requirement entries
+    """
+    try:
+        request = session.get(get_pypi_url(requirement, version), timeout=60)
+        info = request.json(object_pairs_hook=select_pypi_fields)["info"]
+        return info.get("requires_dist") or []
+    except requests.exceptions.RequestException as error:
+        raise ModuleNotFoundError(f"Request error for '{requirement}'.") from error
+    except KeyError as error:
+        raise ModuleNotFoundError from error
+
+
+def get_package_dependencies(
+    requirement: ucstr,
+    version: str = "*",
+    index: Optional[DistributionIndex] = None,
+    environment: Optional[Environment] = None,
+) -> list[tuple[ucstr, str]]:
+    """Get the direct dependencies of a package, from the local metadata if it
+    is installed and from PyPI otherwise.
+
+    :param ucstr requirement: name of the package
+    :param str version: requested version or constraint
+    :param DistributionIndex index: index of the installed distributions
+    :param Environment environment: marker variables of the target
+        environment, those of the running interpreter by default
+    :return list[tuple[ucstr, str]]: names and version constraints
+    """
+    try:
+        requires = get_requires_dist_from_local(requirement, index)
+    except ModuleNotFoundError:
+        try:
+            requires = get_requires_dist_from_pypi(requirement, version)
+        except ModuleNotFoundError:
+            return []
+    dependencies = []
+    for entry in requires:
+        dependency = parse_requires_dist(entry, environment)
+        if dependency is not None:
+            dependencies.append(dependency)
+    return dependencies
+
+
+def resolve_dependency_graph(
+    reqs: set[str],
+    max_workers: int = 8,
+    max_depth: Optional[int] = None,
+    with_size: bool = False,
+    use_cache: bool = True,
+    environment: Optional[Environment] = None,
+) -> DependencyGraph:
+    """Resolve the requirements of a project and all of their transitive
+    dependencies.
+
+    The graph is walked breadth first, each level being resolved in parallel.
+    Every package is resolved once, however many packages depend on it, and
+    cycles do not stop the walk; see `DependencyGraph.find_cycles`.
+
+    :param set[str] reqs: requirements in the format 'package_name=version'
+    :param int max_workers: number of packages resolved concurrently
+    :param int max_depth: levels of dependencies followed below the
+        requirements, unlimited when None
+    :param bool with_size: compute the installed size of local packages
+    :param bool use_cache: read and store results in the persistent
+        `package_cache`
+    :param Environment environment: marker variables of the target
+        environment, those of the running interpreter by default;
+        dependencies whose marker does not hold are left out
+    :return DependencyGraph: the dependency graph, whose `package_set` holds
+        every resolved package
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    index = installed_distributions
+    cache = package_cache if use_cache else None
+
+    def resolve(
+        requirement: tuple[ucstr, str],
+    ) -> tuple[PackageInfo, list[tuple[ucstr, str]]]:
+        name, version = requirement
+        package = resolve_package(name, index, with_size, version, cache)
+        if package.error_code:
+            return package, []
+        return package, get_package_dependencies(name, version, index, environment)
+
+    graph = DependencyGraph()
+    frontier: dict[str, tuple[ucstr, str]] = {}
+    for name, version in get_requirements(reqs):
+        frontier.setdefault(canonicalize_name(name), (name, version))
+    graph.roots = set(frontier)
+
+    depth = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while frontier:
+            next_frontier: dict[str, tuple[ucstr, str]] = {}
+            for key, (package, dependencies) in zip(
+                frontier, pool.map(resolve, frontier.values())
+            ):
+                graph.packages[key] = package
+                children = graph.dependencies.setdefault(key, set())
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                for name, version in dependencies:
+                    child = canonicalize_name(name)
+                    children.add(child)
+                    if child not in graph.packages and child not in frontier:
+                        next_frontier.setdefault(child, (name, version))
+            frontier = next_frontier
+            depth += 1
+    return graph
@@ -0,0 +1,163 @@
+import os
+import sys
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+from licesenser.schemas import canonicalize_name
+
+METADATA_SUFFIXES = (".dist-info", ".egg-info")
+# files listing the installed files, rewritten whenever a distribution changes
+RECORD_FILES = ("RECORD", "installed-files.txt")
+
+
+class DistributionIndex:
+    """Index of the installed distributions keyed by PEP 503 normalized name.
+
+    The search path is scanned once and every lookup is served from the index.
+    It is rebuilt when the search path changes or one of its directories is
+    modified, e.g. when a package is installed into or removed from
+    site-packages.
+    """
+
+    def __init__(self: "DistributionIndex", path: Optional[list[str]] = None) -> None:
+        self._path = path
+        self._signature: Optional[tuple] = None
+        self._distributions: dict[str, metadata.Distribution] = {}
+        self._versions: dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self: "DistributionIndex") -> list[str]:
+        """Directories searched for distributions, `sys.path` by default."""
+        return sys.path if self._path is None else self._path
+
+    def signature(self: "DistributionIndex") -> tuple:
+        """Return a value that changes whenever the search path is modified."""
+        entries = []
+        for entry in self.path:
+            try:
+                entries.append((entry, os.stat(entry or ".").st_mtime_ns))
+            except OSError:
+                entries.append((entry, None))
+        return tuple(entries)
+
+    def refresh(self: "DistributionIndex") -> None:
+        """Rebuild the index if the search path changed since the last build."""
+        signature = self.signature()
+        with self._lock:
+            if signature == self._signature:
+                return
+            distributions: dict[str, metadata.Distribution] = {}
+            versions: dict[str, Optional[str]] = {}
+            for entry in self.path:
+                for name, distribution, version in self._scan(entry or "."):
+                    # earlier entries shadow later ones, like the import system
+                    if name not in distributions:
+                        distributions[name] = distribution
+                        versions[name] = version
+            self._distributions = distributions
+            self._versions = versions
+            self._signature = signature
+
+    def _scan(
+        self: "DistributionIndex", entry: str
+    ) -> list[tuple[str, metadata.Distribution, Optional[str]]]:
+        if not os.path.isdir(entry):
+            # zip files and eggs are left to importlib
+            return [
+                (canonicalize_name(dist.metadata["Name"] or ""), dist, dist.version)
+                for dist in metadata.distributions(path=[entry])
+            ]
+        found = []
+        try:
+            with os.scandir(entry) as it:
+                for item in it:
+                    if item.name.endswith(METADATA_SUFFIXES):
+                        # <name>-<version>[-<tag>].dist-info, the version may be
+                        # missing for egg-info directories of develop installs
+                        parts = item.name.rsplit(".", 1)[0].split("-")
+                        found.append(
+                            (
+                                canonicalize_name(parts[0]),
+                                metadata.PathDistribution(Path(item.path)),
+                                parts[1] if len(parts) > 1 else None,
+                            )
+                        )
+        except OSError:
+            pass
+        return found
+
+    def get(self: "DistributionIndex", name: str) -> metadata.Distribution:
+        """Return the installed distribution for a package name.
+
+        :param str name: package name, in any spelling
+        :raises metadata.PackageNotFoundError: if the package is not installed
+        :return metadata.Distribution: the installed distribution
+        """
+        self.refresh()
+        try:
+            return self._distributions[canonicalize_name(name)]
+        except KeyError as error:
+            raise metadata.PackageNotFoundError(name) from error
+
+    def version(self: "DistributionIndex", name: str) -> str:
+        """Return the installed version of a package.
+
+        The version is taken from the metadata directory name when possible so
+        that the metadata file does not have to be parsed.
+
+        :param str name: package name, in any spelling
+        :raises metadata.PackageNotFoundError: if the package is not installed
+        :return str: installed version
+        """
+        distribution = self.get(name)
+        return self._versions.get(canonicalize_name(name)) or distribution.version
+
+    def __contains__(self: "DistributionIndex", name: object) -> bool:
+        self.refresh()
+        return isinstance(name, str) and canonicalize_name(name) in self._distributions
+
+    def __len__(self: "DistributionIndex") -> int:
+        self.refresh()
+        return len(self._distributions)
+
+
+installed_distributions = DistributionIndex()
+distribution_sizes: dict[str, tuple[int, int]] = {}
+
+
+def get_distribution_size(distribution: metadata.Distribution) -> int:
+    """Return the installed size of a distribution in bytes.
+
+    Summing the sizes listed in RECORD is costly for large packages, so the
+    result is cached per metadata directory and reused until its RECORD file
+    is modified.
+
+    :param metadata.Distribution distribution: installed distribution
+    :return int: total size of the files listed for the distribution
+    """
+    record_key = None
+    if isinstance(distribution, metadata.PathDistribution):
+        path = distribution._path  # type: ignore[attr-defined]
+        for record_file in RECORD_FILES:
+            try:
+                mtime = os.stat(path / record_file).st_mtime_ns
+            except OSError:
+                continue
+            record_key = (str(path), mtime)
+            break
+
+    if record_key is not None:
+        cached = distribution_sizes.get(record_key[0])
+        if cached is not None and cached[0] == record_key[1]:
+            return cached[1]
+
+    size = 0
+    pkg_files = distribution.files
+    if pkg_files is not None:
+        size = sum(pp.size for pp in pkg_files if pp.size is not None)
+    if record_key is not None:
+        distribution_sizes[record_key[0]] = (record_key[1], size)
+    return size
@@ -1,13 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
 from importlib import metadata
 from typing import Any, Optional
 
+import aiohttp
 import requests
 from requests.exceptions import ConnectTimeout
 
-from licesenser.connections import session
-from licesenser.schemas import JOINS, UNKNOWN, PackageInfo, ucstr
+from licesenser.connections import AsyncPyPIClient, session
+from licesenser.license_manager.distribution_index import (
+    DistributionIndex, get_distribution_size, installed_distributions)
+from licesenser.license_manager.license_names import (get_classifier_license,
+                                                      get_spdx_id,
+                                                      normalize_license)
+from licesenser.license_manager.package_cache import (PackageCache,
+                                                      package_cache)
+from licesenser.schemas import (JOINS, UNKNOWN, PackageInfo, canonicalize_name,
+                                ucstr)
+
+# fields of the PyPI JSON API read by this package, at any depth
+PYPI_FIELDS = frozenset(
+    {
+        "info",
+        "urls",
+        "name",
+        "version",
+        "home_page",
+        "author",
+        "author_email",
+        "Author-email",
+        "Author_email",
+        "Maintainer-email",
+        "license",
+        "license_expression",
+        "classifiers",
+        "requires_dist",
+        "size",
+    }
+)
+PINNED_VERSION = re.compile(r"^[0-9][0-9A-Za-z.+!_-]*$")
 
 
 def get_license_from_classifier(classifiers: list[str] | None | list[Any]) -> ucstr:
@@ -19,20 +53,17 @@ def get_license_from_classifier(classifiers: list[str] | None | list[Any]) -> uc
 
     Returns:
     -------
-            str: the license name
+            str: the license names, SPDX identifiers when known, as for the
+            `License` metadata field
 
     """
     if not classifiers:
         return UNKNOWN
     licenses: list[str] = []
     for _val in classifiers:
-        val = str(_val)
-        if val.startswith("License"):
-            lice = val.split(" :: ")
-            if (
-                "OSI Approved" in lice and lice[-1] != "OSI Approved"
-            ):  # license must specify its name
-                licenses.append(lice[-1])
+        lice = get_classifier_license(str(_val))
+        if lice is not None:  # license must specify its name
+            licenses.append(get_spdx_id(lice) or lice)
     return ucstr(JOINS.join(licenses) if len(licenses) > 0 else UNKNOWN)
 
 
@@ -65,21 +96,33 @@ def create_package_info(
     )
 
 
-def get_deps_info_from_local(requirement: ucstr) -> PackageInfo:
+def get_deps_info_from_local(
+    requirement: ucstr,
+    index: Optional[DistributionIndex] = None,
+    with_size: bool = True,
+) -> PackageInfo:
     """Get package info from local files including version, author
     and	the license.
 
     :param str requirement: name of the package
+    :param DistributionIndex index: index of the installed distributions, the
+        search path is scanned for the package when not given
+    :param bool with_size: compute the installed size, left at -1 otherwise
     :raises ModuleNotFoundError: if the package does not exist
     :return PackageInfo: package information
     """
 
     try:
-        package_details = metadata.Distribution.from_name(requirement)
+        if index is not None:
+            package_details = index.get(requirement)
+        else:
+            package_details = metadata.Distribution.from_name(requirement)
         pkg_meta = package_details.metadata
         lice = get_license_from_classifier(pkg_meta.get_all("Classifier"))
         if lice == UNKNOWN:
-            lice = pkg_meta.get("License")
+            lice = normalize_license(
+                pkg_meta.get("License-Expression") or pkg_meta.get("License")
+            )
         name = pkg_meta.get("Name")
         version = pkg_meta.get("Version")
         homePage = pkg_meta.get("Home-page")
@@ -91,10 +134,7 @@ def get_deps_info_from_local(requirement: ucstr) -> PackageInfo:
                 author_email = author_email.split("<")[1][:-1]
                 if not author:
                     author = author_email.split("<")[0][:-1]
-        size = 0
-        pkg_files = package_details.files
-        if pkg_files is not None:
-            size = sum(pp.size for pp in pkg_files if pp.size is not None)
+        size = get_distribution_size(package_details) if with_size else -1
 
         # Use the helper function to create PackageInfo
         return create_package_info(
@@ -113,40 +153,84 @@ def get_deps_info_from_local(requirement: ucstr) -> PackageInfo:
         raise ModuleNotFoundError from error
 
 
-def get_deps_info_from_pypi(requirement: ucstr) -> PackageInfo:
-    """Get package info from PyPI."""
-    try:
-        request = session.get(f"https://pypi.org/pypi/{requirement}/json", timeout=60)
-        response = request.json()
-        info = response.get("info", {})
-        licenseClassifier = get_license_from_classifier(info["classifiers"])
-
-        size = -1
-        urls = response.get("urls", [])
-        if urls:
-            size = int(urls[-1]["size"])
-        author_email = info.get("Maintainer-email")
-        if not author_email:
-            author_email = (
-                info.get("author_email")
-                or info.get("Author-email")
-                or info.get("Author_email")
+def get_pypi_url(requirement: str, version: Optional[str] = None) -> str:
+    """Return the PyPI JSON API url of a package.
+
+    Pinned versions use the per-release endpoint, which does not carry the
+    release history of the project.
+
+    :param str requirement: name of the package
+    :param str version: requested version or constraint
+    :return str: url of the JSON document
+    """
+    if version and PINNED_VERSION.match(version):
+        return f"https://pypi.org/pypi/{requirement}/{version}/json"
+    return f"https://pypi.org/pypi/{requirement}/json"
+
+
+def select_pypi_fields(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """JSON object hook dropping every field PyPI package info is not built from,
+    so the release history and descriptions are discarded while decoding."""
+    return {key: value for key, value in pairs if key in PYPI_FIELDS}
+
+
+def get_deps_info_from_pypi_json(response: dict[str, Any]) -> PackageInfo:
+    """Build package info from a PyPI JSON API response.
+
+    :param dict response: decoded body of `/pypi/<name>/json`
+    :raises KeyError: if the response does not describe a package
+    :return PackageInfo: package information
+    """
+    info = response.get("info", {})
+    licenseClassifier = get_license_from_classifier(info["classifiers"])
+
+    size = -1
+    urls = response.get("urls", [])
+    if urls:
+        size = int(urls[-1]["size"])
+    author_email = info.get("Maintainer-email")
+    if not author_email:
+        author_email = (
+            info.get("author_email")
+            or info.get("Author-email")
+            or info.get("Author_email")
+        )
+        if author_email and "<" in author_email:
+            author_email = author_email.split("<")[1][:-1]
+
+    return create_package_info(
+        name=info.get("name"),
+        latest_version=info.get("version"),
+        homepage=info.get("home_page"),
+        author=info.get("author"),
+        author_email=author_email,
+        size=size,
+        license=ucstr(
+            licenseClassifier
+            if licenseClassifier != UNKNOWN
+            else normalize_license(
+                info.get("license_expression") or info.get("license")
             )
-            if author_email and "<" in author_email:
-                author_email = author_email.split("<")[1][:-1]
+            or UNKNOWN
+        ),
+    )
 
-        return create_package_info(
-            name=info.get("name"),
-            latest_version=info.get("version"),
-            homepage=info.get("home_page"),
-            author=info.get("author"),
-            author_email=author_email,
-            size=size,
-            license=ucstr(
-                licenseClassifier
-                if licenseClassifier != UNKNOWN
-                else info.get("license", UNKNOWN) or UNKNOWN
-            ),
+
+def get_deps_info_from_pypi(
+    requirement: ucstr, version: Optional[str] = None
+) -> PackageInfo:
+    """Get package info from PyPI.
+
+    :param ucstr requirement: name of the package
+    :param str version: requested version, pinned versions are looked up
+        directly instead of the latest release
+    :raises ModuleNotFoundError: if the package could not be fetched
+    :return PackageInfo: package information
+    """
+    try:
+        request = session.get(get_pypi_url(requirement, version), timeout=60)
+        return get_deps_info_from_pypi_json(
+            request.json(object_pairs_hook=select_pypi_fields)
         )
     except ConnectTimeout as error:
         print("Connection timed out while trying to reach PyPI.")
@@ -163,19 +247,230 @@ def get_deps_info_from_pypi(requirement: ucstr) -> PackageInfo:
         raise ModuleNotFoundError from error
 
 
-def get_project_packages(reqs: set[str]) -> set[PackageInfo]:
-    """Get dependency info"""
-    package_info = set()
-    for deps in reqs:
-        requirement = ucstr(deps.split("=")[0])
+async def get_deps_info_from_pypi_async(
+    requirement: ucstr, client: AsyncPyPIClient, version: Optional[str] = None
+) -> PackageInfo:
+    """Get package info from PyPI without blocking the event loop.
+
+    :param ucstr requirement: name of the package
+    :param AsyncPyPIClient client: open client shared by the whole scan
+    :param str version: requested version, pinned versions are looked up
+        directly instead of the latest release
+    :raises ModuleNotFoundError: if the package could not be fetched
+    :return PackageInfo: package information
+    """
+    try:
+        response = await client.get_json(
+            get_pypi_url(requirement, version), object_pairs_hook=select_pypi_fields
+        )
+        return get_deps_info_from_pypi_json(response)
+    except asyncio.TimeoutError as error:
+        print("Connection timed out while trying to reach PyPI.")
+        raise ModuleNotFoundError(
+            f"Could not connect to PyPI for '{requirement}'."
+        ) from error
+    except aiohttp.ClientError as error:
+        print("An error occurred while making a request to PyPI.")
+        raise ModuleNotFoundError(f"Request error for '{requirement}'.") from error
+    except (KeyError, ValueError) as error:
+        raise ModuleNotFoundError from error
+
+
+def get_cache_version(
+    requirement: ucstr, version: str, index: Optional[DistributionIndex] = None
+) -> str:
+    """Return the version a requirement is cached under: the installed version
+    for local packages and the requested version otherwise.
+
+    :param ucstr requirement: name of the package
+    :param str version: requested version or constraint
+    :param DistributionIndex index: index of the installed distributions
+    :return str: version to key the cache with
+    """
+    try:
+        if index is not None:
+            return index.version(requirement)
+        return metadata.version(requirement)
+    except metadata.PackageNotFoundError:
+        return version
+
+
+def get_cached_package(
+    cache: PackageCache, requirement: ucstr, version: str, with_size: bool
+) -> Optional[PackageInfo]:
+    """Return cached package info if it holds everything that was asked for."""
+    package = cache.get(requirement, version)
+    if package is None:
+        return None
+    if with_size and package.size == -1 and package.local_version != UNKNOWN:
+        return None  # cached by a license-only scan
+    return package
+
+
+def resolve_package(
+    requirement: ucstr,
+    index: Optional[DistributionIndex] = None,
+    with_size: bool = True,
+    version: str = "*",
+    cache: Optional[PackageCache] = None,
+) -> PackageInfo:
+    """Resolve a single requirement, trying the local environment first,
+    then PyPI, and falling back to an `error_code=1` placeholder.
 
-        if requirement == "python":
+    :param ucstr requirement: name of the package
+    :param DistributionIndex index: index of the installed distributions
+    :param bool with_size: compute the installed size of local packages
+    :param str version: requested version or constraint
+    :param PackageCache cache: cache of previously resolved packages
+    :return PackageInfo: package information
+    """
+    if cache is not None:
+        cache_version = get_cache_version(requirement, version, index)
+        package = get_cached_package(cache, requirement, cache_version, with_size)
+        if package is not None:
+            return package
+
+    try:
+        package = get_deps_info_from_local(requirement, index, with_size)
+    except ModuleNotFoundError:
+        try:
+            package = get_deps_info_from_pypi(requirement, version)
+        except ModuleNotFoundError:
+            package = create_package_info(name=requirement, error_code=1)
+
+    if cache is not None:
+        cache.set(requirement, cache_version, package)
+    return package
+
+
+def get_requirements(reqs: set[str]) -> list[tuple[ucstr, str]]:
+    """Split requirements into the package names to resolve and their versions.
+
+    Spellings of the same PEP 503 normalized name are deduplicated, so that
+    `typing_extensions` and `Typing.Extensions` are resolved once per version.
+    Conflicting versions of a package are all kept, `*` is dropped when a
+    version of the package is requested.
+
+    :param set[str] reqs: requirements in the format 'package_name=version'
+    :return list[tuple[ucstr, str]]: package names and requested versions,
+        without the python interpreter
+    """
+    requirements: dict[str, dict[str, ucstr]] = {}
+    for deps in sorted(reqs):
+        name, _, version = deps.partition("=")
+        key = canonicalize_name(name)
+        if key == "python":
             continue
+        version = version.strip("=") or "*"
+        requirements.setdefault(key, {}).setdefault(version, ucstr(name))
+
+    result: list[tuple[ucstr, str]] = []
+    for versions in requirements.values():
+        if len(versions) > 1:
+            versions.pop("*", None)
+        result.extend((name, version) for version, name in versions.items())
+    return result
+
+
+def get_project_packages(
+    reqs: set[str],
+    max_workers: int = 1,
+    with_size: bool = False,
+    use_cache: bool = True,
+) -> set[PackageInfo]:
+    """Get dependency info
+
+    :param set[str] reqs: requirements in the format 'package_name=version'
+    :param int max_workers: number of requirements resolved concurrently,
+        1 resolves them one after the other
+    :param bool with_size: compute the installed size of local packages,
+        license-only scans leave it at -1
+    :param bool use_cache: read and store results in the persistent
+        `package_cache`, resolve everything again when False
+    :return set[PackageInfo]: package information for every requirement
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    requirements = get_requirements(reqs)
+    cache = package_cache if use_cache else None
+
+    def resolve(requirement: tuple[ucstr, str]) -> PackageInfo:
+        name, version = requirement
+        return resolve_package(name, installed_distributions, with_size, version, cache)
+
+    if max_workers == 1 or len(requirements) < 2:
+        return {resolve(requirement) for requirement in requirements}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requirements))) as pool:
+        return set(pool.map(resolve, requirements))
+
+
+async def resolve_package_async(
+    requirement: ucstr,
+    client: AsyncPyPIClient,
+    index: Optional[DistributionIndex] = None,
+    with_size: bool = True,
+    version: str = "*",
+    cache: Optional[PackageCache] = None,
+) -> PackageInfo:
+    """Asynchronous counterpart of `resolve_package`.
+
+    :param ucstr requirement: name of the package
+    :param AsyncPyPIClient client: open client shared by the whole scan
+    :param DistributionIndex index: index of the installed distributions
+    :param bool with_size: compute the installed size of local packages
+    :param str version: requested version or constraint
+    :param PackageCache cache: cache of previously resolved packages
+    :return PackageInfo: package information
+    """
+    if cache is not None:
+        cache_version = get_cache_version(requirement, version, index)
+        package = get_cached_package(cache, requirement, cache_version, with_size)
+        if package is not None:
+            return package
+
+    try:
+        package = get_deps_info_from_local(requirement, index, with_size)
+    except ModuleNotFoundError:
         try:
-            package_info.add(get_deps_info_from_local(requirement))
+            package = await get_deps_info_from_pypi_async(requirement, client, version)
         except ModuleNotFoundError:
-            try:
-                package_info.add(get_deps_info_from_pypi(requirement))
-            except ModuleNotFoundError:
-                package_info.add(create_package_info(name=requirement, error_code=1))
-    return package_info
+            package = create_package_info(name=requirement, error_code=1)
+
+    if cache is not None:
+        cache.set(requirement, cache_version, package)
+    return package
+
+
+async def get_project_packages_async(
+    reqs: set[str],
+    max_in_flight: int = 20,
+    with_size: bool = False,
+    use_cache: bool = True,
+) -> set[PackageInfo]:
+    """Get dependency info, resolving every requirement in one event loop.
+
+    :param set[str] reqs: requirements in the format 'package_name=version'
+    :param int max_in_flight: maximum number of concurrent requests to PyPI
+    :param bool with_size: compute the installed size of local packages
+    :param bool use_cache: read and store results in the persistent
+        `package_cache`, resolve everything again when False
+    :return set[PackageInfo]: package information for every requirement
+    """
+    cache = package_cache if use_cache else None
+    async with AsyncPyPIClient(max_in_flight=max_in_flight) as client:
+        results = await asyncio.gather(
+            *(
+                resolve_package_async(
+                    requirement,
+                    client,
+                    installed_distributions,
+                    with_size,
+                    version,
+                    cache,
+                )
+                for requirement, version in get_requirements(reqs)
+            )
+        )
+    return set(results)
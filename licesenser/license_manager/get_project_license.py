@@ -1,19 +1,30 @@
 import asyncio
+import codecs
+import functools
+import hashlib
+import itertools
 import logging
 import os
 import re
-from typing import Union
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
+from typing import (Any, AsyncIterator, Awaitable, Coroutine, Iterable,
+                    Iterator, Optional, TypeVar, Union)
 
 import aiofiles  # type: ignore
 import toml  # type: ignore
 
 from licesenser.enums import LicenseType
+from licesenser.license_manager.license_corpus import match_license_text
+from licesenser.license_manager.scan_cache import ScanCache, ScanEntry
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+T = TypeVar("T")
+
 # Define the files and directories to look for and exclude
 target_files = [
     "license.md",
@@ -39,49 +50,213 @@ exclude_directories = [
 
 
 def should_exclude(directory: str) -> bool:
-    """Check if the given directory should be excluded."""
-    return any(exclude_dir in directory for exclude_dir in exclude_directories)
+    """Check if the given directory should be excluded, based on its name."""
+    return os.path.basename(os.path.normpath(directory)) in exclude_directories
 
 
 class FileFinder:
+    def __init__(
+        self: "FileFinder",
+        target_names: Iterable[str] = target_files,
+        excluded_names: Iterable[str] = exclude_directories,
+        follow_symlinks: bool = False,
+    ) -> None:
+        self.target_names = frozenset(name.lower() for name in target_names)
+        self.excluded_names = frozenset(excluded_names)
+        self.follow_symlinks = follow_symlinks
+
+    def is_target(self: "FileFinder", directory: str, name: str) -> bool:
+        """Tell whether a file of a directory is a target, by its name.
+
+        :param str directory: directory of the file
+        :param str name: name of the file
+        :return bool: whether the name is one of `target_names`, in any case
+        """
+        return name.lower() in self.target_names
+
+    def walk(self: "FileFinder", root_dir: str) -> Iterator[tuple[str, list[str]]]:
+        """Walk the directories of the given root directory, depth first.
+
+        Directories are excluded by name and symlinked directories are only
+        followed when `follow_symlinks` is set, each real directory being
+        visited at most once so that symlink loops terminate.
+
+        :param str root_dir: directory to walk
+        :return Iterator[tuple[str, list[str]]]: every directory visited, with
+            the target files it contains
+        """
+        pending = [root_dir]
+        visited: set[tuple[int, int]] = set()
+        if self.follow_symlinks:
+            stat = os.stat(root_dir)
+            visited.add((stat.st_dev, stat.st_ino))
+        while pending:
+            directory = pending.pop()
+            found_files = []
+            subdirectories = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=self.follow_symlinks)
+                        except OSError:
+                            continue
+                        if not is_dir:
+                            if self.is_target(directory, entry.name):
+                                found_files.append(entry.path)
+                        elif entry.name not in self.excluded_names:
+                            subdirectories.append(entry)
+            except OSError as e:
+                logging.warning(f"Skipping directory {directory}: {e}")
+                continue
+            yield directory, found_files
+
+            for entry in reversed(subdirectories):
+                if self.follow_symlinks:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    if (stat.st_dev, stat.st_ino) in visited:
+                        continue
+                    visited.add((stat.st_dev, stat.st_ino))
+                pending.append(entry.path)
+
+    def iter_files(self: "FileFinder", root_dir: str) -> Iterator[str]:
+        """Yield target files in the given root directory as the walk finds
+        them, see `walk`."""
+        for _, found_files in self.walk(root_dir):
+            yield from found_files
+
     def find_files(self: "FileFinder", root_dir: str) -> list[str]:
-        """Recursively find target files in the given root directory."""
-        found_files = []
-        for root, dirs, files in os.walk(root_dir):
-            # Exclude directories
-            dirs[:] = [d for d in dirs if not should_exclude(os.path.join(root, d))]
-            # Find target files
-            for file in files:
-                if file.lower() in target_files:
-                    found_files.append(os.path.join(root, file))
-        return found_files
+        """Recursively find target files in the given root directory, see
+        `walk`."""
+        return list(self.iter_files(root_dir))
+
+
+# license names are found near the top of a license file, so only the leading
+# window of LICENSE files is read
+LICENSE_READ_LIMIT = 64 * 1024
+UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+
+def decode_text(data: bytes) -> Optional[str]:
+    """Decode file content of unknown encoding.
+
+    UTF-8 and UTF-16 are recognized by their BOM, content without one is read as
+    UTF-8 and falls back to Latin-1, which accepts any byte. A multi-byte
+    character cut at the end of the window is dropped.
+
+    :param bytes data: raw content, possibly truncated
+    :return str | None: decoded text, None if the content is binary
+    """
+    if data.startswith(UTF16_BOMS):
+        return data.decode("utf-16", errors="replace")
+    if b"\x00" in data:
+        return None
+    try:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        return decoder.decode(data, final=False)
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
+
+
+async def read_bytes_async(file_path: str, max_bytes: Optional[int] = None) -> bytes:
+    """Read the raw content of a file asynchronously.
+
+    :param str file_path: path of the file
+    :param int max_bytes: size of the leading window to read, the whole file
+        when None
+    :return bytes: content of the file
+    """
+    async with aiofiles.open(file_path, "rb") as f:
+        return await f.read(-1 if max_bytes is None else max_bytes)
+
+
+async def read_file_async(
+    file_path: str, max_bytes: Optional[int] = None
+) -> Optional[str]:
+    """Read the content of a file asynchronously.
+
+    :param str file_path: path of the file
+    :param int max_bytes: size of the leading window to read, the whole file
+        when None
+    :return str | None: decoded content, None if the file is binary
+    """
+    return decode_text(await read_bytes_async(file_path, max_bytes))
+
+
+WORD_SEPARATOR = r"\s+"
+
+
+def compile_license_pattern() -> re.Pattern[str]:
+    """Compile the names of every license type into a single pattern, with one
+    named group per type and any whitespace allowed between words."""
+    names = {
+        license_type: [re.escape(word) for word in license_type.value.split()]
+        for license_type in LicenseType
+        if license_type not in (LicenseType.NONE, LicenseType.UNKNOWN)
+    }
+    names[LicenseType.LGPL][1] = "(?:Lesser|Library)"
+    return re.compile(
+        "|".join(
+            f"(?P<{license_type.name}>{WORD_SEPARATOR.join(words)})"
+            for license_type, words in names.items()
+        ),
+        re.IGNORECASE,
+    )
 
 
-async def read_file_async(file_path: str) -> str:
-    """Read the content of a file asynchronously."""
-    async with aiofiles.open(file_path, "r") as f:
-        return await f.read()
+license_pattern = compile_license_pattern()
 
 
 def identify_license_from_text(text: str) -> LicenseType:
-    """Identify the license from the given text."""
-    for license_type in LicenseType:
-        if re.search(license_type.value, text, re.IGNORECASE):
-            return license_type
-    return LicenseType.UNKNOWN
+    """Identify the license from the given text.
+
+    The text is scanned once and the license named first wins, so the title of
+    a LGPL or AGPL license text is not shadowed by the GPL it refers to.
+    """
+    match = license_pattern.search(text)
+    if match is None or match.lastgroup is None:
+        return LicenseType.UNKNOWN
+    return LicenseType[match.lastgroup]
 
 
-async def identify_license_from_license_file(file_path: str) -> LicenseType:
-    """Identify the license from a LICENSE file."""
-    content = await read_file_async(file_path)
+async def identify_license_from_license_file(
+    file_path: str,
+    max_bytes: Optional[int] = LICENSE_READ_LIMIT,
+    data: Optional[bytes] = None,
+) -> LicenseType:
+    """Identify the license from the leading `max_bytes` of a LICENSE file.
+
+    A license named by the first line of the file wins, so that a LICENSE
+    bundling third-party licenses after its own is identified by its own. The
+    text is matched against the indexed license texts otherwise, and searched
+    for a license name when it is not a copy of any of them. The file is not
+    read when its leading window is given as `data`.
+    """
+    if data is None:
+        data = await read_bytes_async(file_path, max_bytes)
+    content = decode_text(data)
+    if content is None:
+        return LicenseType.UNKNOWN
+    heading = next((line for line in content.splitlines() if line.strip()), "")
+    license_type = identify_license_from_text(heading)
+    if license_type is not LicenseType.UNKNOWN:
+        return license_type
+    match = match_license_text(content)
+    if match is not None:
+        return match.license_type
     return identify_license_from_text(content)
 
 
 async def identify_license_from_pyproject_toml(
-    file_path: str,
+    file_path: str, data: Optional[bytes] = None
 ) -> LicenseType:
-    """Identify the license from a pyproject.toml file."""
-    content = await read_file_async(file_path)
+    """Identify the license from a pyproject.toml file, or its content `data`."""
+    content = await read_file_async(file_path) if data is None else decode_text(data)
+    if content is None:
+        return LicenseType.NONE
     pyproject = toml.loads(content)
     license_info = pyproject.get("tool", {}).get("poetry", {}).get("license")
     if license_info:
@@ -89,9 +264,13 @@ async def identify_license_from_pyproject_toml(
     return LicenseType.NONE
 
 
-async def identify_license_from_setup_cfg(file_path: str) -> LicenseType:
-    """Identify the license from a setup.cfg file."""
-    content = await read_file_async(file_path)
+async def identify_license_from_setup_cfg(
+    file_path: str, data: Optional[bytes] = None
+) -> LicenseType:
+    """Identify the license from a setup.cfg file, or its content `data`."""
+    content = await read_file_async(file_path) if data is None else decode_text(data)
+    if content is None:
+        return LicenseType.NONE
     lines = content.split("\n")
     license_info = None
     for line in lines:
@@ -103,80 +282,424 @@ async def identify_license_from_setup_cfg(file_path: str) -> LicenseType:
     )
 
 
-async def extract_license_info_async(file_path: str) -> LicenseType:
-    """Extract license information from the given file asynchronously."""
+async def extract_license_info_async(
+    file_path: str,
+    max_bytes: Optional[int] = LICENSE_READ_LIMIT,
+    data: Optional[bytes] = None,
+) -> LicenseType:
+    """Extract license information from the given file asynchronously.
+
+    :param str file_path: path of the file
+    :param int max_bytes: leading window of LICENSE files to scan, the whole
+        file when None
+    :param bytes data: content already read, the leading `max_bytes` of
+        LICENSE files and the whole of other files; the file is read when None
+    :return LicenseType: identified license
+    """
     file_name = os.path.basename(file_path)
     try:
         if file_name.upper() == "LICENSE" or re.match(
             r"^LICENSE\..*", file_name.upper()
         ):
-            return await identify_license_from_license_file(file_path)
+            return await identify_license_from_license_file(file_path, max_bytes, data)
         elif file_name == "pyproject.toml":
-            return await identify_license_from_pyproject_toml(file_path)
+            return await identify_license_from_pyproject_toml(file_path, data)
         elif file_name == "setup.cfg":
-            return await identify_license_from_setup_cfg(file_path)
+            return await identify_license_from_setup_cfg(file_path, data)
     except Exception as e:
         logging.error(f"Error reading file {file_path}: {e}")
     return LicenseType.NONE
 
 
+def get_source_priority(file_path: str) -> int:
+    """Rank a candidate file by how authoritative its license information is,
+    lower being better: LICENSE files, then pyproject.toml, then setup.cfg."""
+    file_name = os.path.basename(file_path).upper()
+    if file_name == "LICENSE" or file_name.startswith("LICENSE."):
+        return 0
+    if file_name == "PYPROJECT.TOML":
+        return 1
+    if file_name == "SETUP.CFG":
+        return 2
+    return 3
+
+
+def run_coroutine_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    A new event loop is used when none is running in this thread. Otherwise the
+    running loop cannot be blocked on, so the coroutine gets its own loop in a
+    worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+def iterate_sync(async_iterator: AsyncIterator[T]) -> Iterator[T]:
+    """Iterate an async iterator from synchronous code.
+
+    The iterator gets its own event loop, run in a worker thread when a loop is
+    already running in this thread, see `run_coroutine_sync`. Closing the
+    iterator early closes the async iterator as well.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pool = None
+    else:
+        pool = ThreadPoolExecutor(max_workers=1)
+
+    def run(coroutine: Awaitable[T]) -> T:
+        if pool is None:
+            return loop.run_until_complete(coroutine)
+        return pool.submit(loop.run_until_complete, coroutine).result()
+
+    try:
+        while True:
+            try:
+                yield run(async_iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        aclose = getattr(async_iterator, "aclose", None)
+        if aclose is not None:
+            run(aclose())
+        loop.close()
+        if pool is not None:
+            pool.shutdown()
+
+
+# distinct contents whose license a `LicenseFinder` remembers
+CLASSIFICATION_MEMO_SIZE = 4096
+
+
 class LicenseFinder:
-    def __init__(self: "LicenseFinder", file_finder: FileFinder) -> None:
+    def __init__(
+        self: "LicenseFinder",
+        file_finder: FileFinder,
+        max_concurrency: int = 32,
+        max_bytes: Optional[int] = LICENSE_READ_LIMIT,
+        scan_cache: Optional[ScanCache] = None,
+        deduplicate: bool = True,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self.file_finder = file_finder
-        self.license_extractor = extract_license_info_async
+        self.license_extractor = functools.partial(
+            extract_license_info_async, max_bytes=max_bytes
+        )
+        self.max_concurrency = max_concurrency
+        self.max_bytes = max_bytes
+        self.scan_cache = scan_cache
+        self.deduplicate = deduplicate
+        self.classifications: dict[tuple[int, str], LicenseType] = {}
+        self.classifying: dict[tuple[int, str], asyncio.Task[LicenseType]] = {}
+        self.waiting: dict[tuple[int, str], int] = {}
 
     def find_all_license_information(
         self: "LicenseFinder", root_dir: str
     ) -> dict[str, LicenseType]:
         """Find and extract all license information from target files."""
-        found_files = self.file_finder.find_files(root_dir)
-        license_info = {}
-        for file_path in found_files:
-            info = asyncio.run(self.license_extractor(file_path))
-            if info:
-                license_info[file_path] = info
-        return license_info
+        return run_coroutine_sync(self.find_all_license_information_async(root_dir))
 
     def find_first_license_information(
-        self: "LicenseFinder", root_dir: str
+        self: "LicenseFinder", root_dir: str, race: bool = False
     ) -> LicenseType:
         """Find and extract the first available license information from target files."""
-        found_files = self.file_finder.find_files(root_dir)
-        for file_path in found_files:
-            info = asyncio.run(self.license_extractor(file_path))
-            if info:
-                return info
-        return LicenseType.NONE
+        return run_coroutine_sync(
+            self.find_first_license_information_async(root_dir, race)
+        )
+
+    async def extract_license_info(
+        self: "LicenseFinder", file_path: str
+    ) -> LicenseType:
+        """Extract license information from a file, incrementally when a
+        `scan_cache` is set.
+
+        A file whose modification time and size are unchanged since the last
+        scan is not read, and one whose content hash is unchanged is not
+        classified again. With `deduplicate`, files are classified once per
+        distinct content, see `classify`. A file is read once: its content is
+        hashed and classified from the same buffer. LICENSE files are read,
+        and so hashed, over their leading `max_bytes` only.
+        """
+        if self.scan_cache is None and not self.deduplicate:
+            return await self.license_extractor(file_path)
+        try:
+            stat = os.stat(file_path)
+            entry = None
+            if self.scan_cache is not None:
+                entry = self.scan_cache.get(file_path, self.max_bytes)
+                if entry is not None and entry.matches(stat):
+                    return entry.license_type
+            window = self.max_bytes if get_source_priority(file_path) == 0 else None
+            data = await read_bytes_async(file_path, window)
+        except OSError:
+            return await self.license_extractor(file_path)
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry.digest == digest:
+            info = entry.license_type
+        elif self.deduplicate:
+            info = await self.classify(file_path, digest, data)
+        else:
+            info = await self.license_extractor(file_path, data=data)
+        if self.scan_cache is not None:
+            self.scan_cache.set(
+                file_path,
+                ScanEntry(stat.st_mtime_ns, stat.st_size, digest, info),
+                self.max_bytes,
+            )
+        return info
+
+    async def classify(
+        self: "LicenseFinder",
+        file_path: str,
+        digest: str,
+        data: Optional[bytes] = None,
+    ) -> LicenseType:
+        """Extract license information from a file unless a file of the same
+        kind and content was already classified.
+
+        Results of the last `CLASSIFICATION_MEMO_SIZE` contents are remembered
+        by this finder and, when a `scan_cache` is set, across scans. Copies
+        classified concurrently share one extraction, which is cancelled only
+        when every copy waiting for it is.
+
+        :param str file_path: path of the file
+        :param str digest: SHA-256 hash of the content of the file
+        :param bytes data: content of the file, read again when None
+        :return LicenseType: identified license
+        """
+        key = (get_source_priority(file_path), digest)
+        info = self.classifications.pop(key, None)
+        if info is None and self.scan_cache is not None:
+            info = self.scan_cache.get_classification(*key, self.max_bytes)
+        if info is not None:
+            self.remember_classification(key, info)
+            return info
+
+        task = self.classifying.get(key)
+        if task is None:
+            task = asyncio.create_task(self.license_extractor(file_path, data=data))
+            self.classifying[key] = task
+
+            def remember(task: asyncio.Task[LicenseType]) -> None:
+                self.classifying.pop(key, None)
+                if task.cancelled() or task.exception() is not None:
+                    return
+                self.remember_classification(key, task.result())
+                if self.scan_cache is not None:
+                    self.scan_cache.set_classification(
+                        *key, self.max_bytes, task.result()
+                    )
+
+            task.add_done_callback(remember)
+        # the extraction is cancelled with the last copy waiting for it
+        self.waiting[key] = self.waiting.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self.waiting[key] == 1:
+                task.cancel()
+            raise
+        finally:
+            self.waiting[key] -= 1
+            if not self.waiting[key]:
+                del self.waiting[key]
+
+    def remember_classification(
+        self: "LicenseFinder", key: tuple[int, str], info: LicenseType
+    ) -> None:
+        """Remember the license of a content, forgetting the least recently
+        used one past `CLASSIFICATION_MEMO_SIZE`."""
+        self.classifications[key] = info
+        if len(self.classifications) > CLASSIFICATION_MEMO_SIZE:
+            del self.classifications[next(iter(self.classifications))]
+
+    async def extract_license_information(
+        self: "LicenseFinder", file_paths: list[str]
+    ) -> list[Union[LicenseType, BaseException]]:
+        """Extract license information from files concurrently, with at most
+        `max_concurrency` files being read at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract(file_path: str) -> LicenseType:
+            async with semaphore:
+                return await self.extract_license_info(file_path)
+
+        return await asyncio.gather(
+            *(extract(file_path) for file_path in file_paths), return_exceptions=True
+        )
+
+    def iter_license_information(
+        self: "LicenseFinder", root_dir: str
+    ) -> Iterator[tuple[str, LicenseType]]:
+        """Yield license information from target files as each is extracted,
+        see `iter_license_information_async`."""
+        return iterate_sync(self.iter_license_information_async(root_dir))
+
+    async def iter_license_information_async(
+        self: "LicenseFinder", root_dir: str
+    ) -> AsyncIterator[tuple[str, LicenseType]]:
+        """Yield license information from target files as each is extracted.
+
+        Files are taken from the walk as extraction slots free up, so at most
+        `max_concurrency` files are pending at a time and extraction starts
+        before the walk is over. Results come in completion order.
+
+        :param str root_dir: directory to scan
+        :return AsyncIterator[tuple[str, LicenseType]]: path and license of
+            every file that could be extracted
+        """
+        file_paths = self.file_finder.iter_files(root_dir)
+        pending: dict[asyncio.Task[LicenseType], str] = {}
+        try:
+            while True:
+                for file_path in itertools.islice(
+                    file_paths, self.max_concurrency - len(pending)
+                ):
+                    task = asyncio.create_task(self.extract_license_info(file_path))
+                    pending[task] = file_path
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    file_path = pending.pop(task)
+                    if task.exception() is None and task.result():
+                        yield file_path, task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def find_all_license_information_async(
         self: "LicenseFinder", root_dir: str
-    ) -> dict[str, Union[LicenseType, BaseException]]:  # fix this later
+    ) -> dict[str, LicenseType]:
         """Find and extract all license information from target files asynchronously."""
         found_files = self.file_finder.find_files(root_dir)
-        tasks = [self.license_extractor(file_path) for file_path in found_files]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        valid_results = [
-            (file_path, info)
-            for file_path, info in zip(found_files, results)
-            if not isinstance(info, Exception)
-        ]
+        results = await self.extract_license_information(found_files)
 
         license_info = {}
-        for file_path, info in valid_results:
-            if info:
+        for file_path, info in zip(found_files, results):
+            if info and not isinstance(info, BaseException):
                 license_info[file_path] = info
 
         return license_info
 
     async def find_first_license_information_async(
-        self: "LicenseFinder", root_dir: str
+        self: "LicenseFinder", root_dir: str, race: bool = False
     ) -> LicenseType:
-        """Find and extract the first available license information from target files asynchronously."""
+        """Find and extract the first available license information from target files asynchronously.
+
+        With `race`, every candidate is extracted concurrently and the best
+        ranked answer is returned, see `race_license_information`.
+        """
         found_files = self.file_finder.find_files(root_dir)
+        if race:
+            return await self.race_license_information(found_files)
         for file_path in found_files:
-            info = await self.license_extractor(file_path)
+            info = await self.extract_license_info(file_path)
             if info:
                 return info
         return LicenseType.NONE
+
+    async def race_license_information(
+        self: "LicenseFinder", file_paths: list[str]
+    ) -> LicenseType:
+        """Extract license information from files concurrently and return the
+        identified license of the most authoritative source.
+
+        Candidates are ranked by `get_source_priority`, then by their order in
+        `file_paths`. Outstanding extractions are cancelled as soon as no pending
+        candidate can beat the best answer found so far.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract(file_path: str) -> LicenseType:
+            async with semaphore:
+                return await self.extract_license_info(file_path)
+
+        ranks = {
+            asyncio.create_task(extract(file_path)): (
+                get_source_priority(file_path),
+                position,
+            )
+            for position, file_path in enumerate(file_paths)
+        }
+        pending = set(ranks)
+        best: Optional[tuple[tuple[int, int], LicenseType]] = None
+        fallback = LicenseType.NONE
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    info = task.result()
+                    if info in (LicenseType.NONE, LicenseType.UNKNOWN):
+                        if info == LicenseType.UNKNOWN:
+                            fallback = info
+                    elif best is None or ranks[task] < best[0]:
+                        best = (ranks[task], info)
+                if best is not None and all(ranks[task] > best[0] for task in pending):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return best[1] if best is not None else fallback
+
+
+def scan_project_root(
+    root_dir: str,
+    file_finder: FileFinder,
+    max_bytes: Optional[int] = LICENSE_READ_LIMIT,
+) -> dict[str, LicenseType]:
+    """Find all license information of one project, in a worker process."""
+    license_finder = LicenseFinder(file_finder, max_bytes=max_bytes)
+    return license_finder.find_all_license_information(root_dir)
+
+
+def scan_project_roots(
+    roots: Iterable[str],
+    max_workers: Optional[int] = None,
+    file_finder: Optional[FileFinder] = None,
+    max_bytes: Optional[int] = LICENSE_READ_LIMIT,
+) -> Iterator[tuple[str, Union[dict[str, LicenseType], BaseException]]]:
+    """Find all license information of many projects across a process pool.
+
+    Each root is walked and extracted in a worker process, and its result is
+    yielded as soon as it completes, so results do not come in the order of
+    `roots`. Roots not started yet are cancelled when the iterator is closed.
+
+    :param Iterable[str] roots: project root directories
+    :param int max_workers: number of worker processes, one per CPU when None
+    :param FileFinder file_finder: target files and excluded directories
+    :param int max_bytes: leading window of LICENSE files to scan
+    :return Iterator: pairs of root and its license information by file, or
+        the exception that stopped the scan of that root
+    """
+    if file_finder is None:
+        file_finder = FileFinder()
+    pool = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            pool.submit(scan_project_root, root, file_finder, max_bytes): root
+            for root in roots
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                yield futures[future], e
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,201 @@
+import json
+import os
+import re
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from licesenser.enums import LicenseType
+
+# licenses of the bundled index, keyed by SPDX identifier
+CORPUS_LICENSES: dict[str, LicenseType] = {
+    "0BSD": LicenseType.BSD,
+    "AGPL-3.0-only": LicenseType.AGPL,
+    "Apache-2.0": LicenseType.APACHE,
+    "Artistic-2.0": LicenseType.ARTISTIC,
+    "BSD-2-Clause": LicenseType.BSD,
+    "BSD-3-Clause": LicenseType.BSD,
+    "CC0-1.0": LicenseType.CC0,
+    "EPL-1.0": LicenseType.EPL,
+    "GPL-2.0-only": LicenseType.GPL,
+    "GPL-3.0-only": LicenseType.GPL,
+    "ISC": LicenseType.ISC,
+    "LGPL-2.1-only": LicenseType.LGPL,
+    "LGPL-3.0-only": LicenseType.LGPL,
+    "MIT": LicenseType.MIT,
+    "MPL-2.0": LicenseType.MPL,
+    "Unlicense": LicenseType.UNLICENSE,
+    "Zlib": LicenseType.ZZ,
+}
+
+LICENSE_INDEX_PATH = os.path.join(
+    os.path.dirname(__file__), "data", "license_index.bin"
+)
+SHINGLE_SIZE = 3  # words per shingle
+SAMPLE_SIZE = 256  # smallest shingle hashes kept per license
+MIN_CONFIDENCE = 0.8
+MIN_COVERAGE = 0.8  # share of the text the matched license must account for
+
+WORDS = re.compile(r"[a-z0-9]+")
+COPYRIGHT_LINE = re.compile(
+    r"^[^\w\n]*(?:copyright|\(c\)|©)\s*(?:\(c\)|©|\d|<).*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# markup of the SPDX license templates
+TEMPLATE_VARIABLE = re.compile(r"<<var;.*?original=(.*?);match=.*?>>", re.DOTALL)
+TEMPLATE_MARKER = re.compile(r"<<(?:beginOptional|endOptional)[^>]*>>")
+
+
+class IndexEntry(NamedTuple):
+    spdx_id: str
+    license_type: LicenseType
+    size: int  # number of distinct shingles of the license text
+    sample: frozenset[int]  # bottom-k sample of the shingle hashes
+
+
+class LicenseMatch(NamedTuple):
+    spdx_id: str
+    license_type: LicenseType
+    confidence: float  # share of the license text found in the matched text
+
+
+def normalize_license_text(text: str) -> list[str]:
+    """Reduce a license text to its words, ignoring case, punctuation, layout
+    and copyright notices."""
+    text = COPYRIGHT_LINE.sub(" ", text).lower().replace("licence", "license")
+    return WORDS.findall(text)
+
+
+def shingle_hashes(words: list[str]) -> set[int]:
+    """Hash every run of `SHINGLE_SIZE` consecutive words."""
+    if len(words) < SHINGLE_SIZE:
+        return set()
+    return {
+        zlib.crc32(" ".join(words[i : i + SHINGLE_SIZE]).encode())
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def expand_license_template(template: str) -> str:
+    """Replace the variables of an SPDX license template by their original
+    text and drop the optional markers."""
+    return TEMPLATE_MARKER.sub("", TEMPLATE_VARIABLE.sub(r"\1", template))
+
+
+def build_license_index(texts: dict[str, str]) -> list[IndexEntry]:
+    """Index license texts.
+
+    :param dict[str, str] texts: license texts or templates keyed by SPDX
+        identifier, see `CORPUS_LICENSES`
+    :return list[IndexEntry]: one entry per license
+    """
+    index = []
+    for spdx_id, text in sorted(texts.items()):
+        hashes = shingle_hashes(normalize_license_text(expand_license_template(text)))
+        sample = frozenset(sorted(hashes)[:SAMPLE_SIZE])
+        index.append(IndexEntry(spdx_id, CORPUS_LICENSES[spdx_id], len(hashes), sample))
+    return index
+
+
+def write_license_index(
+    index: list[IndexEntry], path: str = LICENSE_INDEX_PATH
+) -> None:
+    """Write an index as a one line JSON header followed by the samples as
+    little endian 32 bit integers."""
+    header = {
+        "shingle_size": SHINGLE_SIZE,
+        "entries": [[entry.spdx_id, entry.size, len(entry.sample)] for entry in index],
+    }
+    samples = array("I", (h for entry in index for h in sorted(entry.sample)))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    with open(path, "wb") as f:
+        f.write(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+        f.write(samples.tobytes())
+
+
+def load_license_index(path: str = LICENSE_INDEX_PATH) -> list[IndexEntry]:
+    """Load an index written by `write_license_index`.
+
+    :raises ValueError: if the index was built with another shingle size
+    """
+    with open(path, "rb") as f:
+        header = json.loads(f.readline())
+        samples = array("I")
+        samples.frombytes(f.read())
+    if header["shingle_size"] != SHINGLE_SIZE:
+        raise ValueError(f"Incompatible license index {path}")
+    if sys.byteorder == "big":
+        samples.byteswap()
+    index = []
+    offset = 0
+    for spdx_id, size, sample_size in header["entries"]:
+        sample = frozenset(samples[offset : offset + sample_size])
+        index.append(IndexEntry(spdx_id, CORPUS_LICENSES[spdx_id], size, sample))
+        offset += sample_size
+    return index
+
+
+@lru_cache(maxsize=None)
+def get_license_index() -> list[IndexEntry]:
+    """Return the bundled index, loaded once."""
+    return load_license_index()
+
+
+def match_license_text(
+    text: str,
+    index: Optional[list[IndexEntry]] = None,
+    min_confidence: float = MIN_CONFIDENCE,
+    min_coverage: float = MIN_COVERAGE,
+) -> Optional[LicenseMatch]:
+    """Find the indexed license a text is a copy of.
+
+    The share of each license found in the text is estimated from its bottom-k
+    sample of shingles. Among the licenses found with at least `min_confidence`
+    that make up at least `min_coverage` of the text, the most similar to the
+    text as a whole wins, so a BSD-3-Clause text is not taken for the
+    BSD-2-Clause license it contains. Texts bundling several licenses, or
+    quoting part of one, match none.
+
+    :param str text: license text
+    :param list[IndexEntry] index: index to match against, the bundled one by
+        default
+    :param float min_confidence: minimum share of the license text, from 0 to 1
+    :param float min_coverage: minimum share of the text, from 0 to 1
+    :return LicenseMatch | None: best match, None if no license is found
+    """
+    hashes = shingle_hashes(normalize_license_text(text))
+    if not hashes:
+        return None
+    best: Optional[LicenseMatch] = None
+    best_similarity = 0.0
+    for entry in get_license_index() if index is None else index:
+        confidence = len(entry.sample & hashes) / len(entry.sample)
+        if confidence < min_confidence:
+            continue
+        shared = confidence * entry.size
+        if shared < min_coverage * len(hashes):
+            continue
+        similarity = shared / (entry.size + len(hashes) - shared)
+        if similarity > best_similarity:
+            best = LicenseMatch(entry.spdx_id, entry.license_type, confidence)
+            best_similarity = similarity
+    return best
+
+
+if __name__ == "__main__":
+    # python -m licesenser.license_manager.license_corpus <license-list-data/text>
+    directory = sys.argv[1]
+    texts = {}
+    for spdx_id in CORPUS_LICENSES:
+        for name in (spdx_id, spdx_id.removesuffix("-only")):
+            path = os.path.join(directory, f"{name}.txt")
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    texts[spdx_id] = f.read()
+                break
+        else:
+            sys.exit(f"Missing license text {spdx_id}")
+    write_license_index(build_license_index(texts))
@@ -0,0 +1,204 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+from licesenser.enums import LicenseType
+
+# SPDX identifier (None when the license version or variant is not given) and
+# license type
+LicenseName = tuple[Optional[str], LicenseType]
+
+UNKNOWN_LICENSE: LicenseName = (None, LicenseType.UNKNOWN)
+
+# last segment of the `License ::` trove classifiers
+CLASSIFIER_LICENSES: dict[str, LicenseName] = {
+    "Apache Software License": (None, LicenseType.APACHE),
+    "Artistic License": (None, LicenseType.ARTISTIC),
+    "BSD License": (None, LicenseType.BSD),
+    "Boost Software License 1.0 (BSL-1.0)": ("BSL-1.0", LicenseType.UNKNOWN),
+    "CC0 1.0 Universal (CC0 1.0) Public Domain Dedication": (
+        "CC0-1.0",
+        LicenseType.CC0,
+    ),
+    "Eclipse Public License 1.0 (EPL-1.0)": ("EPL-1.0", LicenseType.EPL),
+    "Eclipse Public License 2.0 (EPL-2.0)": ("EPL-2.0", LicenseType.EPL),
+    "GNU Affero General Public License v3": ("AGPL-3.0-only", LicenseType.AGPL),
+    "GNU Affero General Public License v3 or later (AGPLv3+)": (
+        "AGPL-3.0-or-later",
+        LicenseType.AGPL,
+    ),
+    "GNU General Public License (GPL)": (None, LicenseType.GPL),
+    "GNU General Public License v2 (GPLv2)": ("GPL-2.0-only", LicenseType.GPL),
+    "GNU General Public License v2 or later (GPLv2+)": (
+        "GPL-2.0-or-later",
+        LicenseType.GPL,
+    ),
+    "GNU General Public License v3 (GPLv3)": ("GPL-3.0-only", LicenseType.GPL),
+    "GNU General Public License v3 or later (GPLv3+)": (
+        "GPL-3.0-or-later",
+        LicenseType.GPL,
+    ),
+    "GNU Lesser General Public License v2 (LGPLv2)": (
+        "LGPL-2.0-only",
+        LicenseType.LGPL,
+    ),
+    "GNU Lesser General Public License v2 or later (LGPLv2+)": (
+        "LGPL-2.0-or-later",
+        LicenseType.LGPL,
+    ),
+    "GNU Lesser General Public License v3 (LGPLv3)": (
+        "LGPL-3.0-only",
+        LicenseType.LGPL,
+    ),
+    "GNU Lesser General Public License v3 or later (LGPLv3+)": (
+        "LGPL-3.0-or-later",
+        LicenseType.LGPL,
+    ),
+    "GNU Library or Lesser General Public License (LGPL)": (None, LicenseType.LGPL),
+    "Historical Permission Notice and Disclaimer (HPND)": (
+        "HPND",
+        LicenseType.UNKNOWN,
+    ),
+    "ISC License (ISCL)": ("ISC", LicenseType.ISC),
+    "MIT License": ("MIT", LicenseType.MIT),
+    "MIT No Attribution License (MIT-0)": ("MIT-0", LicenseType.MIT),
+    "Mozilla Public License 1.1 (MPL 1.1)": ("MPL-1.1", LicenseType.MPL),
+    "Mozilla Public License 2.0 (MPL 2.0)": ("MPL-2.0", LicenseType.MPL),
+    "Python Software Foundation License": ("PSF-2.0", LicenseType.UNKNOWN),
+    "The Unlicense (Unlicense)": ("Unlicense", LicenseType.UNLICENSE),
+    "Universal Permissive License (UPL)": ("UPL-1.0", LicenseType.UNKNOWN),
+    "zlib/libpng License": ("Zlib", LicenseType.ZZ),
+}
+
+# common spellings of the `License` metadata field, SPDX identifiers are
+# recognized as well
+LICENSE_ALIASES: dict[str, LicenseName] = {
+    "MIT License": ("MIT", LicenseType.MIT),
+    "The MIT License": ("MIT", LicenseType.MIT),
+    "MIT Licence": ("MIT", LicenseType.MIT),
+    "Expat": ("MIT", LicenseType.MIT),
+    "Apache": (None, LicenseType.APACHE),
+    "Apache 2": ("Apache-2.0", LicenseType.APACHE),
+    "Apache License": (None, LicenseType.APACHE),
+    "Apache License 2.0": ("Apache-2.0", LicenseType.APACHE),
+    "Apache License, Version 2.0": ("Apache-2.0", LicenseType.APACHE),
+    "Apache Software License 2.0": ("Apache-2.0", LicenseType.APACHE),
+    "ASL 2.0": ("Apache-2.0", LicenseType.APACHE),
+    "BSD": (None, LicenseType.BSD),
+    "New BSD": ("BSD-3-Clause", LicenseType.BSD),
+    "New BSD License": ("BSD-3-Clause", LicenseType.BSD),
+    "Modified BSD": ("BSD-3-Clause", LicenseType.BSD),
+    "3-Clause BSD": ("BSD-3-Clause", LicenseType.BSD),
+    "3-Clause BSD License": ("BSD-3-Clause", LicenseType.BSD),
+    "BSD 3-Clause License": ("BSD-3-Clause", LicenseType.BSD),
+    "Simplified BSD": ("BSD-2-Clause", LicenseType.BSD),
+    "2-Clause BSD": ("BSD-2-Clause", LicenseType.BSD),
+    "BSD 2-Clause License": ("BSD-2-Clause", LicenseType.BSD),
+    "ISC License": ("ISC", LicenseType.ISC),
+    "ISCL": ("ISC", LicenseType.ISC),
+    "GPL": (None, LicenseType.GPL),
+    "GPLv2": ("GPL-2.0-only", LicenseType.GPL),
+    "GPLv2+": ("GPL-2.0-or-later", LicenseType.GPL),
+    "GPL-2.0": ("GPL-2.0-only", LicenseType.GPL),
+    "GPL-2.0+": ("GPL-2.0-or-later", LicenseType.GPL),
+    "GPLv3": ("GPL-3.0-only", LicenseType.GPL),
+    "GPLv3+": ("GPL-3.0-or-later", LicenseType.GPL),
+    "GPL-3.0": ("GPL-3.0-only", LicenseType.GPL),
+    "GPL-3.0+": ("GPL-3.0-or-later", LicenseType.GPL),
+    "LGPL": (None, LicenseType.LGPL),
+    "LGPLv2.1": ("LGPL-2.1-only", LicenseType.LGPL),
+    "LGPLv2.1+": ("LGPL-2.1-or-later", LicenseType.LGPL),
+    "LGPL-2.1": ("LGPL-2.1-only", LicenseType.LGPL),
+    "LGPL-2.1+": ("LGPL-2.1-or-later", LicenseType.LGPL),
+    "LGPLv3": ("LGPL-3.0-only", LicenseType.LGPL),
+    "LGPLv3+": ("LGPL-3.0-or-later", LicenseType.LGPL),
+    "LGPL-3.0": ("LGPL-3.0-only", LicenseType.LGPL),
+    "LGPL-3.0+": ("LGPL-3.0-or-later", LicenseType.LGPL),
+    "AGPL": (None, LicenseType.AGPL),
+    "AGPLv3": ("AGPL-3.0-only", LicenseType.AGPL),
+    "AGPLv3+": ("AGPL-3.0-or-later", LicenseType.AGPL),
+    "AGPL-3.0": ("AGPL-3.0-only", LicenseType.AGPL),
+    "MPL 2.0": ("MPL-2.0", LicenseType.MPL),
+    "MPL2": ("MPL-2.0", LicenseType.MPL),
+    "Mozilla Public License 2.0": ("MPL-2.0", LicenseType.MPL),
+    "Eclipse Public License 2.0": ("EPL-2.0", LicenseType.EPL),
+    "The Unlicense": ("Unlicense", LicenseType.UNLICENSE),
+    "zlib License": ("Zlib", LicenseType.ZZ),
+    "zlib/libpng": ("Zlib", LicenseType.ZZ),
+    "CC0": ("CC0-1.0", LicenseType.CC0),
+    "CC0 1.0 Universal": ("CC0-1.0", LicenseType.CC0),
+    "PSF": ("PSF-2.0", LicenseType.UNKNOWN),
+    "PSF License": ("PSF-2.0", LicenseType.UNKNOWN),
+    "Python Software Foundation License": ("PSF-2.0", LicenseType.UNKNOWN),
+}
+
+SEPARATORS = re.compile(r"[^A-Z0-9.+]+")
+
+
+def normalize_license_key(license: str) -> str:
+    """Reduce a license string to the form the lookup table is keyed with."""
+    return SEPARATORS.sub(" ", license.upper()).strip(" .")
+
+
+def build_license_table() -> dict[str, LicenseName]:
+    table: dict[str, LicenseName] = {}
+    for names in (CLASSIFIER_LICENSES, LICENSE_ALIASES):
+        for name, license_name in names.items():
+            table[normalize_license_key(name)] = license_name
+            if license_name[0] is not None:
+                table.setdefault(normalize_license_key(license_name[0]), license_name)
+    return table
+
+
+LICENSE_TABLE = build_license_table()
+
+
+@lru_cache(maxsize=None)
+def get_classifier_license(classifier: str) -> Optional[str]:
+    """Return the license name of an OSI approved license classifier.
+
+    :param str classifier: trove classifier
+    :return str | None: last segment of the classifier, None if it is not an
+        OSI approved license naming its license
+    """
+    if not classifier.startswith("License"):
+        return None
+    lice = classifier.split(" :: ")
+    if "OSI Approved" in lice and lice[-1] != "OSI Approved":
+        return lice[-1]
+    return None
+
+
+@lru_cache(maxsize=4096)
+def identify_license_name(license: str) -> LicenseName:
+    """Map a license classifier or `License` metadata string to its SPDX
+    identifier and license type.
+
+    :param str license: e.g. `License :: OSI Approved :: MIT License`,
+        `Apache License, Version 2.0` or `BSD-3-Clause`
+    :return LicenseName: SPDX identifier and license type, `UNKNOWN_LICENSE`
+        when the string is not recognized
+    """
+    if license.startswith("License ::"):
+        license = license.rsplit(" :: ", 1)[-1]
+    if len(license) > 100:  # full license texts are not names
+        return UNKNOWN_LICENSE
+    return LICENSE_TABLE.get(normalize_license_key(license), UNKNOWN_LICENSE)
+
+
+def get_spdx_id(license: str) -> Optional[str]:
+    """Return the SPDX identifier of a license string, if known."""
+    return identify_license_name(license)[0]
+
+
+def get_license_type(license: str) -> LicenseType:
+    """Return the license type of a license string."""
+    return identify_license_name(license)[1]
+
+
+def normalize_license(license: Optional[str]) -> Optional[str]:
+    """Return the SPDX identifier of a license string when it is known, and
+    the string unchanged otherwise."""
+    if not license:
+        return license
+    return get_spdx_id(license) or license
@@ -0,0 +1,76 @@
+import os
+from typing import Optional
+
+import diskcache
+
+from licesenser.connections import CACHE_DIR, CACHE_EXPIRE_AFTER
+from licesenser.schemas import PackageInfo, canonicalize_name
+
+PACKAGE_CACHE_TTL = CACHE_EXPIRE_AFTER.total_seconds()
+PACKAGE_CACHE_SIZE_LIMIT = 2**26  # 64 MiB
+NEGATIVE_CACHE_TTL = 60 * 60.0
+# bump when the resolved package information changes, to drop stale entries
+PACKAGE_CACHE_VERSION = 2
+
+
+class PackageCache:
+    """Persistent cache of resolved package information.
+
+    Entries are keyed by the PEP 503 normalized package name and version, expire
+    after `ttl` seconds, and the least recently used ones are evicted once the
+    cache grows past `size_limit` bytes. Packages that could not be found
+    (`error_code` set) are remembered for the shorter `negative_ttl`, so that
+    unknown names are not looked up again on every scan.
+    """
+
+    def __init__(
+        self: "PackageCache",
+        directory: str = os.path.join(CACHE_DIR, "packages"),
+        ttl: Optional[float] = PACKAGE_CACHE_TTL,
+        size_limit: int = PACKAGE_CACHE_SIZE_LIMIT,
+        negative_ttl: Optional[float] = NEGATIVE_CACHE_TTL,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.cache = diskcache.Cache(
+            directory,
+            size_limit=size_limit,
+            eviction_policy="least-recently-used",
+        )
+
+    @staticmethod
+    def key(name: str, version: str) -> str:
+        """Return the cache key of a package version."""
+        return f"{PACKAGE_CACHE_VERSION}:{canonicalize_name(name)}=={version}"
+
+    def get(self: "PackageCache", name: str, version: str) -> Optional[PackageInfo]:
+        """Return the cached package information, if any.
+
+        :param str name: package name, in any spelling
+        :param str version: installed version or version constraint
+        :return PackageInfo | None: cached package information
+        """
+        return self.cache.get(self.key(name, version))
+
+    def set(
+        self: "PackageCache", name: str, version: str, package: PackageInfo
+    ) -> None:
+        """Store package information.
+
+        :param str name: package name, in any spelling
+        :param str version: installed version or version constraint
+        :param PackageInfo package: package information to store
+        """
+        ttl = self.negative_ttl if package.error_code else self.ttl
+        self.cache.set(self.key(name, version), package, expire=ttl)
+
+    def clear(self: "PackageCache") -> int:
+        """Remove every entry and return how many were removed."""
+        return self.cache.clear()
+
+    def close(self: "PackageCache") -> None:
+        """Close the underlying database."""
+        self.cache.close()
+
+
+package_cache = PackageCache()
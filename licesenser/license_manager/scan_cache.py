@@ -0,0 +1,116 @@
+import os
+from typing import NamedTuple, Optional
+
+import diskcache
+
+from licesenser.connections import CACHE_DIR
+from licesenser.enums import LicenseType
+
+SCAN_CACHE_SIZE_LIMIT = 2**26  # 64 MiB
+# bump when the classifier or the bundled license index changes, to drop stale
+# results
+SCAN_CACHE_VERSION = 2
+
+
+class ScanEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str  # SHA-256 hash of the content read
+    license_type: LicenseType
+
+    def matches(self: "ScanEntry", stat: os.stat_result) -> bool:
+        """Tell whether the file is unchanged since it was scanned."""
+        return (self.mtime_ns, self.size) == (stat.st_mtime_ns, stat.st_size)
+
+
+class ScanCache:
+    """Persistent license information of the files of scanned projects.
+
+    Entries are keyed by `SCAN_CACHE_VERSION`, absolute file path and the size
+    of the leading window the file was read with. They record the modification
+    time, size and content hash of the file, so that a later scan only reads
+    the files whose stat changed and only classifies again the files whose
+    content changed.
+    The license of every distinct content is stored as well, so that copies of
+    a license file are classified once, wherever they are. The least recently
+    used entries are evicted once the cache grows past `size_limit` bytes.
+
+    Scans are only incremental when a `ScanCache` is passed to `LicenseFinder`;
+    none is opened by default.
+    """
+
+    def __init__(
+        self: "ScanCache",
+        directory: str = os.path.join(CACHE_DIR, "scans"),
+        size_limit: int = SCAN_CACHE_SIZE_LIMIT,
+    ) -> None:
+        self.cache = diskcache.Cache(
+            directory,
+            size_limit=size_limit,
+            eviction_policy="least-recently-used",
+        )
+
+    @staticmethod
+    def key(file_path: str, max_bytes: Optional[int]) -> str:
+        """Return the cache key of a file."""
+        return f"{SCAN_CACHE_VERSION}:{os.path.abspath(file_path)}:{max_bytes}"
+
+    def get(
+        self: "ScanCache", file_path: str, max_bytes: Optional[int] = None
+    ) -> Optional[ScanEntry]:
+        """Return the entry of a file, if it was scanned before.
+
+        :param str file_path: path of the file
+        :param int max_bytes: leading window the file is read with
+        :return ScanEntry | None: result of the last scan
+        """
+        return self.cache.get(self.key(file_path, max_bytes))
+
+    def set(
+        self: "ScanCache",
+        file_path: str,
+        entry: ScanEntry,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """Store the result of scanning a file.
+
+        :param str file_path: path of the file
+        :param ScanEntry entry: stat, content hash and license of the file
+        :param int max_bytes: leading window the file was read with
+        """
+        self.cache.set(self.key(file_path, max_bytes), entry)
+
+    @staticmethod
+    def classification_key(source: int, digest: str, max_bytes: Optional[int]) -> str:
+        """Return the cache key of a file content."""
+        return f"{SCAN_CACHE_VERSION}:sha256:{digest}:{source}:{max_bytes}"
+
+    def get_classification(
+        self: "ScanCache", source: int, digest: str, max_bytes: Optional[int] = None
+    ) -> Optional[LicenseType]:
+        """Return the license of a file content, if a copy was scanned before.
+
+        :param int source: kind of file, see `get_source_priority`
+        :param str digest: content hash of the file
+        :param int max_bytes: leading window the file is read with
+        :return LicenseType | None: license of the content
+        """
+        return self.cache.get(self.classification_key(source, digest, max_bytes))
+
+    def set_classification(
+        self: "ScanCache",
+        source: int,
+        digest: str,
+        max_bytes: Optional[int],
+        license_type: LicenseType,
+    ) -> None:
+        """Store the license of a file content."""
+        self.cache.set(self.classification_key(source, digest, max_bytes), license_type)
+
+    def clear(self: "ScanCache") -> int:
+        """Remove every entry and return how many were removed."""
+        return self.cache.clear()
+
+    def close(self: "ScanCache") -> None:
+        """Close the underlying database."""
+        self.cache.close()
@@ -0,0 +1,292 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+from typing import Iterator, NamedTuple, Optional, Union
+
+from licesenser.dependency_reader.discovery import MANIFEST_READERS
+from licesenser.enums import LicenseType
+from licesenser.license_manager.get_project_license import (FileFinder,
+                                                            LicenseFinder,
+                                                            run_coroutine_sync)
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+)
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class LicenseDelta(NamedTuple):
+    path: str
+    previous: Optional[LicenseType]  # None when the file is new
+    current: Optional[LicenseType]  # None when the file was removed
+
+
+class DependencyDelta(NamedTuple):
+    path: str
+    added: frozenset[str]
+    removed: frozenset[str]
+
+
+Delta = Union[LicenseDelta, DependencyDelta]
+
+
+class Inotify:
+    """Minimal binding of the Linux inotify API, see inotify(7).
+
+    :raises OSError: if inotify is not available
+    """
+
+    def __init__(self: "Inotify") -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories: dict[int, str] = {}
+
+    def add_watch(self: "Inotify", directory: str) -> None:
+        """Watch the entries of a directory."""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), directory)
+        self.directories[wd] = directory
+
+    def read_events(
+        self: "Inotify", timeout: Optional[float] = None
+    ) -> list[tuple[str, str, int]]:
+        """Wait up to `timeout` seconds for events.
+
+        :param float timeout: seconds to wait, forever when None
+        :return list[tuple[str, str, int]]: directory, entry name and mask of
+            each event, with an empty directory for `IN_Q_OVERFLOW`
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_IGNORED:
+                self.directories.pop(wd, None)
+            elif mask & IN_Q_OVERFLOW:
+                events.append(("", "", mask))
+            elif wd in self.directories:
+                events.append((self.directories[wd], name, mask))
+        return events
+
+    def close(self: "Inotify") -> None:
+        os.close(self.fd)
+
+
+class ProjectWatcher:
+    """Keep the license and dependency information of a project current.
+
+    The target files of `license_finder` and the `MANIFEST_READERS` manifests
+    are watched with inotify where available, and by walking the project every
+    `poll_interval` seconds otherwise. Only the files that changed are read
+    again, and changes are reported as `LicenseDelta` and `DependencyDelta`.
+    """
+
+    def __init__(
+        self: "ProjectWatcher",
+        root_dir: str,
+        license_finder: Optional[LicenseFinder] = None,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        self.root_dir = root_dir
+        self.license_finder = license_finder or LicenseFinder(FileFinder())
+        self.poll_interval = poll_interval
+        file_finder = self.license_finder.file_finder
+        self.license_names = file_finder.target_names
+        self.file_finder = FileFinder(
+            file_finder.target_names | set(MANIFEST_READERS),
+            file_finder.excluded_names,
+            file_finder.follow_symlinks,
+        )
+        self.licenses: dict[str, LicenseType] = {}
+        self.dependencies: dict[str, set[str]] = {}
+        self.stats: dict[str, tuple[int, int]] = {}
+        self.inotify: Optional[Inotify] = None
+        if use_inotify:
+            try:
+                self.inotify = Inotify()
+            except OSError as e:
+                logging.warning(f"Watching {root_dir} by polling: {e}")
+
+    def __enter__(self: "ProjectWatcher") -> "ProjectWatcher":
+        return self
+
+    def __exit__(self: "ProjectWatcher", *exc_info: object) -> None:
+        self.close()
+
+    def close(self: "ProjectWatcher") -> None:
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    def find_files(self: "ProjectWatcher", directory: str) -> list[str]:
+        """Find the watched files below a directory, watching every directory
+        walked when inotify is used."""
+        found_files = []
+        for walked, files in self.file_finder.walk(directory):
+            if self.inotify is not None:
+                try:
+                    self.inotify.add_watch(walked)
+                except OSError as e:
+                    logging.warning(f"Not watching {walked}: {e}")
+            found_files.extend(files)
+        return found_files
+
+    def scan(self: "ProjectWatcher") -> list[Delta]:
+        """Read every watched file, reporting the initial information as
+        deltas from an empty project."""
+        return self.update(set(self.find_files(self.root_dir)) | set(self.stats))
+
+    def poll_changes(self: "ProjectWatcher") -> set[str]:
+        """Walk the project and return the files added, removed or modified
+        since they were last read."""
+        stats = {}
+        for file_path in self.file_finder.find_files(self.root_dir):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            stats[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return {
+            file_path
+            for file_path in stats.keys() | self.stats.keys()
+            if stats.get(file_path) != self.stats.get(file_path)
+        }
+
+    def wait_for_changes(self: "ProjectWatcher", timeout: Optional[float]) -> set[str]:
+        """Wait up to `timeout` seconds for files to change."""
+        if self.inotify is None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not (changes := self.poll_changes()):
+                if deadline is None:
+                    time.sleep(self.poll_interval)
+                elif (remaining := deadline - time.monotonic()) > 0:
+                    time.sleep(min(self.poll_interval, remaining))
+                else:
+                    break
+            return changes
+
+        changes: set[str] = set()
+        for directory, name, mask in self.inotify.read_events(timeout):
+            path = os.path.join(directory, name)
+            if mask & IN_Q_OVERFLOW:
+                changes |= self.poll_changes()
+            elif not mask & IN_ISDIR:
+                # a created file is read once it is closed
+                if (
+                    not mask & IN_CREATE
+                    and name.lower() in self.file_finder.target_names
+                ):
+                    changes.add(path)
+            elif mask & (IN_CREATE | IN_MOVED_TO):
+                if name not in self.file_finder.excluded_names:
+                    changes.update(self.find_files(path))
+            else:
+                prefix = os.path.join(path, "")
+                changes.update(p for p in self.stats if p.startswith(prefix))
+        return changes
+
+    def check(self: "ProjectWatcher", timeout: Optional[float] = None) -> list[Delta]:
+        """Wait up to `timeout` seconds for changes and return their deltas."""
+        return self.update(self.wait_for_changes(timeout))
+
+    def watch(self: "ProjectWatcher") -> Iterator[list[Delta]]:
+        """Scan the project, then yield the deltas of every change, forever."""
+        deltas = self.scan()
+        while True:
+            if deltas:
+                yield deltas
+            deltas = self.check(self.poll_interval)
+
+    def update(self: "ProjectWatcher", paths: set[str]) -> list[Delta]:
+        """Read the given files again and return how their information
+        changed."""
+        existing = []
+        for file_path in sorted(paths):
+            try:
+                stat = os.stat(file_path)
+                self.stats[file_path] = (stat.st_mtime_ns, stat.st_size)
+                existing.append(file_path)
+            except OSError:
+                self.stats.pop(file_path, None)
+
+        license_files = [
+            file_path
+            for file_path in existing
+            if os.path.basename(file_path).lower() in self.license_names
+        ]
+        results = run_coroutine_sync(
+            self.license_finder.extract_license_information(license_files)
+        )
+        licenses = {
+            file_path: info
+            for file_path, info in zip(license_files, results)
+            if not isinstance(info, BaseException)
+        }
+
+        deltas: list[Delta] = []
+        for file_path in sorted(paths):
+            name = os.path.basename(file_path).lower()
+            if name in self.license_names:
+                previous = self.licenses.pop(file_path, None)
+                current = licenses.get(file_path)
+                if current is not None:
+                    self.licenses[file_path] = current
+                if current != previous:
+                    deltas.append(LicenseDelta(file_path, previous, current))
+            if name in MANIFEST_READERS:
+                delta = self.update_dependencies(file_path, name)
+                if delta is not None:
+                    deltas.append(delta)
+        return deltas
+
+    def update_dependencies(
+        self: "ProjectWatcher", file_path: str, name: str
+    ) -> Optional[DependencyDelta]:
+        """Read a manifest again, keeping its previous dependencies when it
+        cannot be parsed."""
+        previous = self.dependencies.pop(file_path, set())
+        current: set[str] = set()
+        if file_path in self.stats:
+            try:
+                current = MANIFEST_READERS[name]().read_dependencies(file_path)
+            except Exception as e:
+                logging.error(f"Error reading file {file_path}: {e}")
+                current = previous
+            self.dependencies[file_path] = current
+        if current == previous:
+            return None
+        return DependencyDelta(
+            file_path, frozenset(current - previous), frozenset(previous - current)
+        )
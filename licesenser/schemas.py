@@ -1,7 +1,12 @@
+import re
+import sys
+from functools import lru_cache
 from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from licesenser.license_manager.license_names import get_spdx_id
+
 
 class ucstr(str):
     """Uppercase string."""
@@ -22,6 +27,22 @@ class ucstr(str):
         return handler.generate_schema(str)
 
 
+NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+
+@lru_cache(maxsize=8192)
+def canonicalize_name(name: str) -> str:
+    """Normalize a package name as described in PEP 503.
+
+    Every spelling is normalized once and the result is interned, so the
+    names of readers, resolver and caches share one string per package.
+
+    :param str name: package name, e.g. `Typing.Extensions`
+    :return str: normalized name, e.g. `typing-extensions`
+    """
+    return sys.intern(NAME_SEPARATORS.sub("-", name).lower())
+
+
 UNKNOWN = ucstr("UNKNOWN")
 JOINS = ucstr(";; ")
 
@@ -46,6 +67,17 @@ class PackageInfo(BaseModel):
         """Return the name and local version."""
         return f"{self.name}-{self.local_version}"
 
+    @property
+    def canonical_name(self) -> str:
+        """Return the PEP 503 normalized name."""
+        return canonicalize_name(self.name)
+
+    @property
+    def license_ids(self) -> tuple[str, ...]:
+        """Return the SPDX identifiers of the recognized licenses."""
+        ids = (get_spdx_id(lice) for lice in self.license.split(JOINS))
+        return tuple(spdx_id for spdx_id in ids if spdx_id is not None)
+
     @field_validator("name")
     def name_must_not_be_empty(cls, v):
         if not v:
@@ -53,13 +85,13 @@ class PackageInfo(BaseModel):
         return v
 
     def __hash__(self):
-        return hash((self.name, self.local_version, self.latest_version))
+        return hash((self.canonical_name, self.local_version, self.latest_version))
 
     def __eq__(self, other):
         if not isinstance(other, PackageInfo):
             return NotImplemented
-        return (self.name, self.local_version, self.latest_version) == (
-            other.name,
+        return (self.canonical_name, self.local_version, self.latest_version) == (
+            other.canonical_name,
             other.local_version,
             other.latest_version,
         )
@@ -75,3 +107,46 @@ class PackageInfo(BaseModel):
             for k, v in self.model_dump().items()  # Use Pydantic's dict method
             if k.upper() not in hide_output_parameters
         }
+
+
+class DependencyGraph(BaseModel):
+    """DependencyGraph type, nodes are keyed by PEP 503 normalized name."""
+
+    roots: set[str] = Field(default_factory=set)
+    packages: dict[str, PackageInfo] = Field(default_factory=dict)
+    dependencies: dict[str, set[str]] = Field(default_factory=dict)
+
+    @property
+    def package_set(self) -> set[PackageInfo]:
+        """Return the flat set of every package in the graph."""
+        return set(self.packages.values())
+
+    def find_cycles(self) -> list[list[str]]:
+        """Return the dependency cycles of the graph.
+
+        :return list[list[str]]: each cycle as the path of names leading back
+            to its first element
+        """
+        cycles = []
+        done: set[str] = set()
+        for root in sorted(self.dependencies):
+            if root in done:
+                continue
+            path = [root]
+            on_path = {root}
+            stack = [iter(sorted(self.dependencies.get(root, ())))]
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    node = path.pop()
+                    on_path.discard(node)
+                    done.add(node)
+                    continue
+                if child in on_path:
+                    cycles.append(path[path.index(child) :] + [child])
+                elif child not in done:
+                    path.append(child)
+                    on_path.add(child)
+                    stack.append(iter(sorted(self.dependencies.get(child, ()))))
+        return cycles
@@ -1,6 +1,42 @@
+import json
+from typing import Optional, TextIO
+
 import click  # type: ignore
 
+from licesenser.license_manager.get_project_license import scan_project_roots
+
 
 @click.command()
 def create() -> None:
     ...
+
+
+@click.command()
+@click.argument("roots", nargs=-1, type=click.Path(file_okay=False))
+@click.option(
+    "--roots-from",
+    type=click.File("r"),
+    help="File listing project roots, one per line.",
+)
+@click.option("--workers", type=int, help="Number of worker processes.")
+def scan_licenses(
+    roots: tuple[str, ...], roots_from: Optional[TextIO], workers: Optional[int]
+) -> None:
+    """Scan the license files of many project roots, printing one JSON line
+    per root as soon as it is scanned."""
+    all_roots = list(roots)
+    if roots_from is not None:
+        all_roots.extend(line.strip() for line in roots_from if line.strip())
+    for root, result in scan_project_roots(all_roots, max_workers=workers):
+        if isinstance(result, BaseException):
+            line = {"root": root, "error": str(result)}
+        else:
+            line = {
+                "root": root,
+                "licenses": {path: info.value for path, info in result.items()},
+            }
+        click.echo(json.dumps(line))
+
+
+if __name__ == "__main__":
+    scan_licenses()
@@ -1,11 +1,14 @@
 import os
 import tempfile
 from typing import Generator
+from unittest.mock import patch
 
 import pytest  # type: ignore
 
+from licesenser.dependency_reader.manifest_cache import ManifestCache
 from licesenser.license_manager.get_project_license import (FileFinder,
                                                             LicenseFinder)
+from licesenser.license_manager.package_cache import PackageCache
 from tests.data.mock_data import (empty_license, invalid_file_content,
                                   invalid_licenses,
                                   mock_directory_invalid_structure,
@@ -13,6 +16,30 @@ from tests.data.mock_data import (empty_license, invalid_file_content,
                                   valid_licenses)
 
 
+@pytest.fixture(autouse=True)
+def package_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[PackageCache, None, None]:
+    """Keep resolved packages out of the user's cache directory."""
+    cache = PackageCache(str(tmp_path_factory.mktemp("packages")))
+    with patch(
+        "licesenser.license_manager.get_dependency_license.package_cache", cache
+    ):
+        yield cache
+    cache.close()
+
+
+@pytest.fixture(autouse=True)
+def manifest_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[ManifestCache, None, None]:
+    """Keep parsed manifests out of the user's cache directory."""
+    cache = ManifestCache(str(tmp_path_factory.mktemp("manifests")))
+    with patch("licesenser.dependency_reader.discovery.manifest_cache", cache):
+        yield cache
+    cache.close()
+
+
 @pytest.fixture(scope="module")
 def pipfile_data() -> str:
     return os.path.join(os.path.dirname(__file__), "data", "Pipfile")
@@ -28,6 +55,16 @@ def requirements_data() -> str:
     return os.path.join(os.path.dirname(__file__), "data", "requirements.txt")
 
 
+@pytest.fixture(scope="module")
+def poetry_lock_data() -> str:
+    return os.path.join(os.path.dirname(__file__), "data", "poetry.lock")
+
+
+@pytest.fixture(scope="module")
+def pipfile_lock_data() -> str:
+    return os.path.join(os.path.dirname(__file__), "data", "Pipfile.lock")
+
+
 @pytest.fixture(scope="module")
 def unsupported_data() -> str:
     return os.path.join(os.path.dirname(__file__), "data", "dependencies.json")
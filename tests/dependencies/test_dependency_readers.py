@@ -1,7 +1,10 @@
 import pytest
 
+from licesenser.dependency_reader.dependency import LockedDependency
 from licesenser.dependency_reader.deps_reader import DependencyFileReader
 from licesenser.dependency_reader.pipfile import PipfileReader
+from licesenser.dependency_reader.pipfile_lock import PipfileLockReader
+from licesenser.dependency_reader.poetry_lock import PoetryLockReader
 from licesenser.dependency_reader.poetry_toml import PyprojectTomlReader
 from licesenser.dependency_reader.requirements_txt import RequirementsTxtReader
 
@@ -52,6 +55,119 @@ def test_requirements_txt_reader(requirements_data: str) -> None:
         assert dependencies == expected_dependencies
 
 
+def test_requirements_txt_reader_markers(tmp_path) -> None:
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text(
+        'pywin32==306; sys_platform == "win32"\n'
+        'requests==2.25.1; sys_platform == "linux"\n'
+    )
+    reader = RequirementsTxtReader({"sys_platform": "linux"})
+    assert reader.read_dependencies(str(requirements)) == {"requests=2.25.1"}
+
+
+def test_pyproject_toml_reader_pep621(tmp_path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[project]\nname = "demo"\ndependencies = [\n'
+        '    "requests[socks]>=2.25,<3",\n'
+        "    \"tomli; python_version < '3.11'\",\n"
+        '    "click==8.1.7",\n]\n\n'
+        '[project.optional-dependencies]\ntest = ["pytest"]\n\n'
+        "[tool.poetry.dependencies]\n"
+        'colorama = {version = "^0.4", markers = "sys_platform == \'win32\'"}\n'
+        'numpy = {version = "1.21.0", optional = true}\n'
+    )
+    reader = PyprojectTomlReader({"python_version": "3.12", "sys_platform": "linux"})
+    assert reader.read_dependencies(str(pyproject)) == {
+        "requests=>=2.25,<3",
+        "click=8.1.7",
+    }
+
+
+def test_poetry_lock_reader(poetry_lock_data: str) -> None:
+    reader = PoetryLockReader()
+    assert reader.read_locked_dependencies(poetry_lock_data) == [
+        LockedDependency(
+            "certifi",
+            "2024.8.30",
+            (
+                "sha256:922820b53db7a7257ffbda3f597266d435245903d80737e34f8a45ff3e3230d8",
+                "sha256:bec941d2aa8195e248a60b31ff9f0558284cf01a52591ceda73ea9afffd69fd9",
+            ),
+        ),
+        LockedDependency(
+            "requests",
+            "2.32.3",
+            (
+                "sha256:70761cfe03c773ceb22aa2f671b4757976145175cdfca038c02654d061d6dcc6",
+            ),
+        ),
+        LockedDependency("idna", "3.10", ()),
+    ]
+    assert reader.read_dependencies(poetry_lock_data) == {
+        "certifi=2024.8.30",
+        "requests=2.32.3",
+        "idna=3.10",
+    }
+
+
+def test_poetry_lock_reader_legacy_hashes(tmp_path) -> None:
+    lock_file = tmp_path / "poetry.lock"
+    lock_file.write_text(
+        '[[package]]\nname = "Typing_Extensions"\nversion = "4.12.2"\n\n'
+        '[metadata]\ncontent-hash = "abc"\n\n[metadata.files]\n'
+        'typing-extensions = [\n    {file = "typing_extensions-4.12.2.tar.gz", '
+        'hash = "sha256:1a7ead55"},\n]\n'
+    )
+    assert PoetryLockReader().read_locked_dependencies(str(lock_file)) == [
+        LockedDependency("Typing_Extensions", "4.12.2", ("sha256:1a7ead55",))
+    ]
+
+
+def test_lock_readers_markers(tmp_path, caplog) -> None:
+    poetry_lock = tmp_path / "poetry.lock"
+    poetry_lock.write_text(
+        '[[package]]\nname = "colorama"\nversion = "0.4.6"\n'
+        'markers = "sys_platform == \\"win32\\""\n\n'
+        '[[package]]\nname = "idna"\nversion = "3.10"\n'
+    )
+    pipfile_lock = tmp_path / "Pipfile.lock"
+    pipfile_lock.write_text(
+        '{"default": {"colorama": {"version": "==0.4.6", '
+        '"markers": "sys_platform == \'win32\'"}, "idna": {"version": "==3.10"}}}'
+    )
+    environment = {"sys_platform": "linux"}
+    assert PoetryLockReader(environment).read_dependencies(str(poetry_lock)) == {
+        "idna=3.10"
+    }
+    assert PipfileLockReader(environment).read_dependencies(str(pipfile_lock)) == {
+        "idna=3.10"
+    }
+    assert PoetryLockReader({"sys_platform": "win32"}).read_dependencies(
+        str(poetry_lock)
+    ) == {"colorama=0.4.6", "idna=3.10"}
+    # packages without markers are kept without evaluating any
+    assert not caplog.records
+
+
+def test_pipfile_lock_reader(pipfile_lock_data: str) -> None:
+    reader = PipfileLockReader()
+    dependencies = reader.read_locked_dependencies(pipfile_lock_data)
+    assert [dependency.name for dependency in dependencies] == [
+        "certifi",
+        "requests",
+        "pytest",
+    ]
+    assert dependencies[1].hashes == (
+        "sha256:70761cfe03c773ceb22aa2f671b4757976145175cdfca038c02654d061d6dcc6",
+    )
+    assert reader.read_dependencies(pipfile_lock_data) == {
+        "certifi=2024.8.30",
+        "requests=2.32.3",
+        "pytest=8.3.3",
+    }
+
+
 def test_dependency_context(
     pipfile_data: str, requirements_data: str, pyproject_data: str
 ) -> None:
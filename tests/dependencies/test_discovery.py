@@ -0,0 +1,167 @@
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from licesenser.dependency_reader.discovery import (discover_dependencies,
+                                                    find_manifests,
+                                                    get_manifest_reader)
+from licesenser.dependency_reader.manifest_cache import ManifestCache
+from licesenser.dependency_reader.pep508 import DEFAULT_ENVIRONMENT
+from licesenser.dependency_reader.pipfile_lock import PipfileLockReader
+from licesenser.dependency_reader.requirements_txt import RequirementsTxtReader
+
+
+@pytest.fixture
+def projects(tmp_path, pyproject_data: str, poetry_lock_data: str):
+    service = tmp_path / "service"
+    (service / "worker").mkdir(parents=True)
+    shutil.copy(pyproject_data, service / "pyproject.toml")
+    shutil.copy(poetry_lock_data, service / "poetry.lock")
+    (service / "worker" / "requirements.txt").write_text("requests==2.32.3\nrq==2.0\n")
+    (service / "tests").mkdir()
+    (service / "tests" / "requirements.txt").write_text("pytest==8.3.3\n")
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "Pipfile").write_text("[packages\n")
+    (other / "requirements.txt").write_text("idna==3.10\n")
+    return str(service), str(other)
+
+
+def test_get_manifest_reader() -> None:
+    assert isinstance(get_manifest_reader("app/Pipfile.lock"), PipfileLockReader)
+    with pytest.raises(ValueError):
+        get_manifest_reader("setup.py")
+    with pytest.raises(ValueError):
+        get_manifest_reader("docs/notes.txt")
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "requirements.txt",
+        "requirements-dev.txt",
+        "Requirements_test.txt",
+        "dev-requirements.txt",
+        "test_requirements.txt",
+        "requirements/base.txt",
+    ],
+)
+def test_get_manifest_reader_requirements_files(file_path) -> None:
+    assert isinstance(get_manifest_reader(file_path), RequirementsTxtReader)
+
+
+def test_find_manifests_requirements_files(tmp_path) -> None:
+    (tmp_path / "requirements").mkdir()
+    for name in (
+        "requirements-dev.txt",
+        "dev-requirements.txt",
+        "requirements/base.txt",
+        "notes.txt",
+    ):
+        (tmp_path / name).write_text("idna==3.10\n")
+    assert sorted(find_manifests(str(tmp_path))) == [
+        f"{tmp_path}/dev-requirements.txt",
+        f"{tmp_path}/requirements-dev.txt",
+        f"{tmp_path}/requirements/base.txt",
+    ]
+
+
+def test_find_manifests_prefers_lockfiles(projects) -> None:
+    service, _ = projects
+    assert sorted(find_manifests(service)) == [
+        f"{service}/poetry.lock",
+        f"{service}/worker/requirements.txt",
+    ]
+    assert len(find_manifests(service, prefer_lockfiles=False)) == 3
+
+
+def test_discover_dependencies(projects) -> None:
+    service, other = projects
+    dependencies = discover_dependencies(projects, max_workers=2)
+    assert dependencies == {
+        "certifi=2024.8.30": {f"{service}/poetry.lock"},
+        "idna=3.10": {f"{service}/poetry.lock", f"{other}/requirements.txt"},
+        "requests=2.32.3": {
+            f"{service}/poetry.lock",
+            f"{service}/worker/requirements.txt",
+        },
+        "rq=2.0": {f"{service}/worker/requirements.txt"},
+    }
+    assert discover_dependencies(other) == {"idna=3.10": {f"{other}/requirements.txt"}}
+
+
+def test_discover_dependencies_uses_cache(projects, manifest_cache) -> None:
+    service, other = projects
+    with patch(
+        "licesenser.dependency_reader.requirements_txt.RequirementsTxtReader.read_dependencies",
+        side_effect=RequirementsTxtReader().read_dependencies,
+    ) as read_dependencies:
+        first = discover_dependencies(projects)
+        assert read_dependencies.call_count == 2
+        assert discover_dependencies(projects) == first
+        assert read_dependencies.call_count == 2
+
+        # same content elsewhere is not parsed again
+        copy = os.path.join(os.path.dirname(other), "copy")
+        os.mkdir(copy)
+        shutil.copy(os.path.join(other, "requirements.txt"), copy)
+        discover_dependencies(copy)
+        assert read_dependencies.call_count == 2
+
+        discover_dependencies(projects, use_cache=False)
+        assert read_dependencies.call_count == 4
+
+
+def test_discover_dependencies_included_file_changed(tmp_path, manifest_cache) -> None:
+    (tmp_path / "base.txt").write_text("requests==2.32.3\n")
+    (tmp_path / "requirements.txt").write_text("-r base.txt\nidna==3.10\n")
+    assert set(discover_dependencies(str(tmp_path))) == {
+        "requests=2.32.3",
+        "idna=3.10",
+    }
+
+    (tmp_path / "base.txt").write_text("requests==2.32.3\nurllib3==2.0\n")
+    assert set(discover_dependencies(str(tmp_path))) == {
+        "requests=2.32.3",
+        "idna=3.10",
+        "urllib3=2.0",
+    }
+
+
+def test_discover_dependencies_target_environment(tmp_path, manifest_cache) -> None:
+    (tmp_path / "requirements.txt").write_text(
+        'idna==3.10\ncolorama==0.4.6; sys_platform == "win32"\n'
+    )
+    linux = {**DEFAULT_ENVIRONMENT, "sys_platform": "linux"}
+    windows = {**DEFAULT_ENVIRONMENT, "sys_platform": "win32"}
+    assert set(discover_dependencies(str(tmp_path), environment=linux)) == {"idna=3.10"}
+    assert set(discover_dependencies(str(tmp_path), environment=windows)) == {
+        "idna=3.10",
+        "colorama=0.4.6",
+    }
+    assert set(discover_dependencies(str(tmp_path), environment=linux)) == {"idna=3.10"}
+
+
+def test_discover_dependencies_merges_spellings(tmp_path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "requirements.txt").write_text("Typing_Extensions==4.12.2\n")
+    (tmp_path / "b" / "requirements.txt").write_text("typing.extensions==4.12.2\n")
+    assert discover_dependencies(str(tmp_path), use_cache=False) == {
+        "typing-extensions=4.12.2": {
+            f"{tmp_path}/a/requirements.txt",
+            f"{tmp_path}/b/requirements.txt",
+        }
+    }
+
+
+def test_manifest_cache(tmp_path) -> None:
+    cache = ManifestCache(str(tmp_path))
+    cache.set("Pipfile", "abc", {"requests=*", "numpy=1.21.0"})
+    cache.set("requirements.txt", "abc", set())
+    assert cache.get("pipfile", "abc") == {"requests=*", "numpy=1.21.0"}
+    assert cache.get("requirements.txt", "abc") == set()
+    assert cache.get("Pipfile", "def") is None
+    assert cache.clear() == 2
@@ -0,0 +1,142 @@
+import pytest
+
+from licesenser.dependency_reader.pep508 import (Requirement, evaluate_marker,
+                                                 format_dependency,
+                                                 parse_marker,
+                                                 parse_requirement,
+                                                 read_requirements_file)
+
+ENVIRONMENT = {
+    "python_version": "3.12",
+    "python_full_version": "3.12.1",
+    "sys_platform": "linux",
+    "os_name": "posix",
+    "platform_system": "Linux",
+    "extra": "",
+}
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("requests", Requirement("requests", frozenset(), "", None, None)),
+        (
+            "requests[Socks, security] >= 2.8, < 3",
+            Requirement(
+                "requests", frozenset({"socks", "security"}), ">=2.8,<3", None, None
+            ),
+        ),
+        (
+            'tomli==2.0.1; python_version < "3.11"',
+            Requirement(
+                "tomli", frozenset(), "==2.0.1", None, 'python_version < "3.11"'
+            ),
+        ),
+        (
+            "charset_normalizer (<4,>=2)",
+            Requirement("charset_normalizer", frozenset(), "<4,>=2", None, None),
+        ),
+        (
+            "pip @ https://example.com/pip-24.0.zip",
+            Requirement(
+                "pip", frozenset(), "", "https://example.com/pip-24.0.zip", None
+            ),
+        ),
+    ],
+)
+def test_parse_requirement(line, expected):
+    assert parse_requirement(line) == expected
+
+
+@pytest.mark.parametrize("line", ["", "Bad Name", "requests >=", "-e ."])
+def test_parse_requirement_invalid(line):
+    with pytest.raises(ValueError):
+        parse_requirement(line)
+
+
+@pytest.mark.parametrize(
+    "line, version",
+    [("numpy==1.21.0", "1.21.0"), ("numpy>=1.21", ">=1.21"), ("numpy", "*")],
+)
+def test_requirement_version(line, version):
+    assert parse_requirement(line).version == version
+
+
+@pytest.mark.parametrize(
+    "marker, expected",
+    [
+        ('python_version >= "3.8"', True),
+        ('python_version < "3.10"', False),
+        ('"3.12" == python_version', True),
+        ('python_full_version == "3.12.*"', True),
+        ('python_version ~= "3.9"', True),
+        ('sys_platform == "win32" or os_name == "posix"', True),
+        ('sys_platform == "linux" and (os_name == "nt" or extra == "test")', False),
+        ('"linux" in sys_platform and platform_system != "Windows"', True),
+        ('extra == "socks"', False),
+    ],
+)
+def test_evaluate_marker(marker, expected):
+    assert evaluate_marker(marker, ENVIRONMENT) is expected
+
+
+def test_evaluate_marker_extra():
+    environment = {**ENVIRONMENT, "extra": "Socks"}
+    assert evaluate_marker('extra == "socks"', environment)
+
+
+@pytest.mark.parametrize("marker", ['python_version >= "3.8" and', "os_name ==", "("])
+def test_malformed_marker(marker):
+    with pytest.raises(ValueError):
+        parse_marker(marker)
+    # malformed markers keep the requirement
+    assert evaluate_marker(marker, ENVIRONMENT)
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("==1.21.0", "numpy=1.21.0"),
+        ({"version": "^1.21"}, "numpy=^1.21"),
+        ({"version": "*", "markers": 'python_version < "3.8"'}, None),
+        ({"version": "*", "markers": 'python_version >= "3.8"'}, "numpy=*"),
+        ({"version": "1.21.0", "optional": True}, None),
+    ],
+)
+def test_format_dependency(spec, expected):
+    assert format_dependency("numpy", spec, ENVIRONMENT) == expected
+
+
+def test_read_requirements_file_includes(tmp_path):
+    (tmp_path / "base.txt").write_text(
+        "requests>=2.25 \\\n"
+        "    --hash=sha256:aaaa --hash=sha256:bbbb\n"
+        "-c constraints.txt\n"
+    )
+    (tmp_path / "constraints.txt").write_text(
+        "requests==2.32.3\nnumpy==1.21.0  # not a requirement\n"
+    )
+    (tmp_path / "requirements.txt").write_text(
+        "# development requirements\n"
+        "-r base.txt\n"
+        "--index-url https://pypi.org/simple\n"
+        "-e .\n"
+        'pywin32==306; sys_platform == "win32"\n'
+        "pytest[testing]\n"
+        "-r requirements.txt\n"
+    )
+
+    lines = read_requirements_file(str(tmp_path / "requirements.txt"), ENVIRONMENT)
+
+    assert [line.requirement.to_dependency() for line in lines] == [
+        "requests=2.32.3",
+        "pytest=*",
+    ]
+    assert lines[0].hashes == ("sha256:aaaa", "sha256:bbbb")
+    assert lines[0].source == str(tmp_path / "base.txt")
+
+
+def test_read_requirements_file_missing_include(tmp_path):
+    (tmp_path / "requirements.txt").write_text("-r missing.txt\n")
+    with pytest.raises(FileNotFoundError):
+        read_requirements_file(str(tmp_path / "requirements.txt"), ENVIRONMENT)
@@ -0,0 +1,144 @@
+# type:ignore
+from unittest.mock import patch
+
+import pytest
+
+from licesenser.dependency_reader.pep508 import DEFAULT_ENVIRONMENT
+from licesenser.license_manager.dependency_graph import (
+    get_package_dependencies, parse_requires_dist, resolve_dependency_graph)
+from licesenser.license_manager.distribution_index import DistributionIndex
+from licesenser.license_manager.get_dependency_license import \
+    create_package_info
+
+mock_requires = {
+    "APP": [("LIB-A", ">=1"), ("LIB-B", "*")],
+    "LIB-A": [("SHARED", "2.0")],
+    "LIB-B": [("SHARED", "*"), ("LIB-C", "*")],
+    "LIB-C": [("LIB-B", "*")],
+    "SHARED": [],
+}
+
+
+def mock_resolve_package(
+    requirement, index=None, with_size=True, version="*", cache=None
+):
+    if requirement == "MISSING":
+        return create_package_info(name=requirement, error_code=1)
+    return create_package_info(name=requirement.lower(), latest_version=version)
+
+
+def mock_get_package_dependencies(
+    requirement, version="*", index=None, environment=None
+):
+    return mock_requires[requirement]
+
+
+@pytest.fixture
+def mock_resolution():
+    with (
+        patch(
+            "licesenser.license_manager.dependency_graph.resolve_package",
+            side_effect=mock_resolve_package,
+        ) as resolve,
+        patch(
+            "licesenser.license_manager.dependency_graph.get_package_dependencies",
+            side_effect=mock_get_package_dependencies,
+        ),
+    ):
+        yield resolve
+
+
+@pytest.mark.parametrize(
+    "entry, expected",
+    [
+        ("idna<4,>=2.5", ("IDNA", "<4,>=2.5")),
+        ("charset_normalizer (<4,>=2)", ("CHARSET_NORMALIZER", "<4,>=2")),
+        ("urllib3[socks]==2.0.0", ("URLLIB3", "2.0.0")),
+        ('tomli; python_version < "3.11"', None),
+        ('colorama; sys_platform == "win32"', None),
+        ('PySocks!=1.5.7,>=1.5.6; extra == "socks"', None),
+        ('foo; python_version >= "3.8" and extra != "x"', ("FOO", "*")),
+    ],
+)
+def test_parse_requires_dist(entry, expected):
+    environment = {**DEFAULT_ENVIRONMENT, "python_version": "3.11"}
+    environment["sys_platform"] = "linux"
+    assert parse_requires_dist(entry, environment) == expected
+
+
+def test_parse_requires_dist_target_environment():
+    environment = {**DEFAULT_ENVIRONMENT, "python_version": "3.10"}
+    environment["sys_platform"] = "win32"
+    for entry in (
+        'tomli; python_version < "3.11"',
+        'colorama; sys_platform == "win32"',
+    ):
+        assert parse_requires_dist(entry, environment) is not None
+
+
+def test_get_package_dependencies_from_local(tmp_path):
+    dist_info = tmp_path / "app-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: app\nVersion: 1.0\n"
+        "Requires-Dist: lib-a>=1\n"
+        'Requires-Dist: pytest; extra == "test"\n'
+    )
+    index = DistributionIndex([str(tmp_path)])
+    assert get_package_dependencies("APP", "*", index) == [("LIB-A", ">=1")]
+
+
+def test_resolve_dependency_graph_skips_unmet_markers(tmp_path):
+    dist_info = tmp_path / "app-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: app\nVersion: 1.0\n"
+        'Requires-Dist: colorama; sys_platform == "win32"\n'
+        'Requires-Dist: tomli; python_version < "3.11"\n'
+    )
+    index = DistributionIndex([str(tmp_path)])
+    environment = {**DEFAULT_ENVIRONMENT, "python_version": "3.11"}
+    environment["sys_platform"] = "linux"
+    with (
+        patch(
+            "licesenser.license_manager.dependency_graph.installed_distributions",
+            index,
+        ),
+        patch(
+            "licesenser.license_manager.dependency_graph.resolve_package",
+            side_effect=mock_resolve_package,
+        ) as resolve,
+        patch(
+            "licesenser.license_manager.dependency_graph.get_requires_dist_from_pypi"
+        ) as pypi,
+    ):
+        graph = resolve_dependency_graph(
+            {"app=1.0"}, use_cache=False, environment=environment
+        )
+    assert set(graph.packages) == {"app"}
+    assert resolve.call_count == 1
+    pypi.assert_not_called()
+
+
+def test_resolve_dependency_graph(mock_resolution):
+    graph = resolve_dependency_graph({"app=1.0"}, max_workers=4)
+    assert graph.roots == {"app"}
+    assert set(graph.packages) == {"app", "lib-a", "lib-b", "lib-c", "shared"}
+    assert graph.dependencies["app"] == {"lib-a", "lib-b"}
+    assert len(graph.package_set) == 5
+    # shared is reachable twice but resolved once
+    assert mock_resolution.call_count == 5
+    assert graph.find_cycles() == [["lib-b", "lib-c", "lib-b"]]
+
+
+def test_resolve_dependency_graph_max_depth(mock_resolution):
+    graph = resolve_dependency_graph({"app=1.0"}, max_depth=1)
+    assert set(graph.packages) == {"app", "lib-a", "lib-b"}
+    assert graph.find_cycles() == []
+
+
+def test_resolve_dependency_graph_missing_package(mock_resolution):
+    graph = resolve_dependency_graph({"missing=1.0", "python=^3.12"})
+    assert graph.roots == {"missing"}
+    assert graph.packages["missing"].error_code == 1
+    assert graph.dependencies["missing"] == set()
@@ -1,4 +1,5 @@
 # type:ignore
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,7 +8,10 @@ from requests import ConnectTimeout
 
 from licesenser.license_manager.get_dependency_license import (
     create_package_info, get_deps_info_from_local, get_deps_info_from_pypi,
-    get_license_from_classifier, get_project_packages)
+    get_deps_info_from_pypi_json, get_license_from_classifier,
+    get_project_packages, get_pypi_url, get_requirements, select_pypi_fields)
+from licesenser.license_manager.license_names import normalize_license
+from licesenser.schemas import canonicalize_name
 
 # Mock data for classifiers
 mock_classifiers = [
@@ -107,10 +111,14 @@ def test_get_license_from_classifier():
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
     ]
     license_str = get_license_from_classifier(classifiers)
-    assert (
-        license_str
-        == "MIT License;; Apache Software License;; GNU General Public License v3 (GPLv3)".upper()
-    )
+    assert license_str == "MIT;; APACHE SOFTWARE LICENSE;; GPL-3.0-ONLY"
+
+
+def test_get_license_from_classifier_matches_license_field():
+    """The classifier and the `License` field name a license the same way."""
+    assert get_license_from_classifier(
+        ["License :: OSI Approved :: MIT License"]
+    ) == normalize_license("The MIT License")
 
 
 def test_get_license_from_classifier_no_classifiers():
@@ -186,10 +194,7 @@ def test_get_deps_info_from_local(mock_get_deps_info_from_local):
     assert package_info.author == "John Doe"
     assert package_info.author_email == "john.doe@example.com"
     assert package_info.size == 1024
-    assert (
-        package_info.license
-        == "MIT License;; Apache Software License;; GNU General Public License v3 (GPLv3)".upper()
-    )
+    assert package_info.license == "MIT;; APACHE SOFTWARE LICENSE;; GPL-3.0-ONLY"
     assert package_info.error_code == 0
 
 
@@ -219,10 +224,7 @@ def test_get_deps_info_from_pypi(mock_pypi_response_fixture):
     assert package_info.author == "John Doe"
     assert package_info.author_email == "john.doe@example.com"
     assert package_info.size == 1024
-    assert (
-        package_info.license
-        == "MIT License;; Apache Software License;; GNU General Public License v3 (GPLv3)".upper()
-    )
+    assert package_info.license == "MIT;; APACHE SOFTWARE LICENSE;; GPL-3.0-ONLY"
     assert package_info.error_code == 0
 
 
@@ -375,3 +377,107 @@ def test_get_project_packages_with_invalid_reqs():
     mock_requirements_with_invalid = {"example", "invalid==format"}
     package_info_set = get_project_packages(mock_requirements_with_invalid)
     assert len(package_info_set) == 1  # Should only include valid example package
+
+
+def test_get_project_packages_concurrent_matches_sequential():
+    """Test that resolving requirements concurrently keeps the local, PyPI,
+    then error_code=1 fallback order and returns the same packages."""
+
+    def local(requirement, index=None, with_size=True):
+        if requirement == "LOCAL":
+            return create_package_info(name="local", local_version="1.0.0")
+        raise ModuleNotFoundError
+
+    def pypi(requirement, version=None):
+        if requirement == "REMOTE":
+            return create_package_info(name="remote", latest_version="2.0.0")
+        raise ModuleNotFoundError
+
+    reqs = {"local=1.0.0", "remote=*", "missing=0.1"}
+    with patch(
+        "licesenser.license_manager.get_dependency_license.get_deps_info_from_local",
+        side_effect=local,
+    ), patch(
+        "licesenser.license_manager.get_dependency_license.get_deps_info_from_pypi",
+        side_effect=pypi,
+    ):
+        sequential = get_project_packages(reqs)
+        concurrent = get_project_packages(reqs, max_workers=4)
+
+    assert sequential == concurrent
+    by_name = {pkg.name: pkg for pkg in concurrent}
+    assert by_name["local"].local_version == "1.0.0"
+    assert by_name["remote"].latest_version == "2.0.0"
+    assert by_name["MISSING"].error_code == 1
+
+
+def test_get_requirements_deduplicates_spellings():
+    reqs = {"typing_extensions=*", "Typing.Extensions=4.12.2", "python=^3.8"}
+    assert get_requirements(reqs) == [("TYPING.EXTENSIONS", "4.12.2")]
+
+
+def test_get_requirements_keeps_conflicting_pins():
+    reqs = {"foo=1.0", "Foo=2.0", "FOO=*", "Foo=1.0"}
+    assert sorted(get_requirements(reqs)) == [("FOO", "1.0"), ("FOO", "2.0")]
+
+
+def test_canonicalize_name_interned():
+    name = canonicalize_name("Typing_Extensions")
+    assert name == "typing-extensions"
+    assert canonicalize_name("typing.extensions") is name
+
+
+def test_get_project_packages_resolves_each_package_once():
+    reqs = {"typing_extensions=4.12.2", "Typing-Extensions=4.12.2", "idna=3.10"}
+    with patch(
+        "licesenser.license_manager.get_dependency_license.resolve_package",
+        side_effect=lambda name, *args: create_package_info(name=name),
+    ) as resolve:
+        packages = get_project_packages(reqs, use_cache=False)
+    assert resolve.call_count == 2
+    assert {package.canonical_name for package in packages} == {
+        "typing-extensions",
+        "idna",
+    }
+    assert create_package_info(name="typing_extensions") == create_package_info(
+        name="TYPING-EXTENSIONS"
+    )
+
+
+def test_get_project_packages_invalid_workers():
+    with pytest.raises(ValueError):
+        get_project_packages({"example"}, max_workers=0)
+
+
+def test_get_pypi_url_pinned_version():
+    assert (
+        get_pypi_url("example", "1.0.0") == "https://pypi.org/pypi/example/1.0.0/json"
+    )
+    assert get_pypi_url("example", "2.0.0rc1") == (
+        "https://pypi.org/pypi/example/2.0.0rc1/json"
+    )
+    for version in (None, "*", "^1.0.0", "~=1.0", ">=1.0", "1.0.*"):
+        assert get_pypi_url("example", version) == "https://pypi.org/pypi/example/json"
+
+
+def test_get_deps_info_from_pypi_pinned_version(mock_pypi_response_fixture):
+    get_deps_info_from_pypi("example", "1.0.0")
+    assert mock_pypi_response_fixture.call_args.args == (
+        "https://pypi.org/pypi/example/1.0.0/json",
+    )
+
+
+def test_select_pypi_fields_drops_release_history():
+    document = json.dumps(
+        {
+            "info": {**mock_pypi_response["info"], "description": "x" * 1000},
+            "last_serial": 1,
+            "releases": {"0.1.0": [{"size": 1, "filename": "example-0.1.0.tar.gz"}]},
+            "urls": [{"size": 1024, "filename": "example-1.0.0.tar.gz"}],
+        }
+    )
+    response = json.loads(document, object_pairs_hook=select_pypi_fields)
+    assert set(response) == {"info", "urls"}
+    assert "description" not in response["info"]
+    assert response["urls"] == [{"size": 1024}]
+    assert get_deps_info_from_pypi_json(response).size == 1024
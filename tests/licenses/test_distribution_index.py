@@ -0,0 +1,93 @@
+# type:ignore
+import os
+from importlib import metadata
+
+import pytest
+
+from licesenser.license_manager.distribution_index import (
+    DistributionIndex, get_distribution_size)
+from licesenser.license_manager.get_dependency_license import \
+    get_deps_info_from_local
+
+
+def make_dist_info(site_packages, dirname: str, name: str, version: str) -> None:
+    dist_info = site_packages / dirname
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        "Classifier: License :: OSI Approved :: MIT License\n"
+    )
+
+
+@pytest.fixture
+def site_packages(tmp_path):
+    make_dist_info(
+        tmp_path, "typing_extensions-4.12.2.dist-info", "typing_extensions", "4.12.2"
+    )
+    make_dist_info(tmp_path, "zope.interface-7.0.egg-info", "zope.interface", "7.0")
+    return tmp_path
+
+
+def test_distribution_index_normalized_lookup(site_packages):
+    index = DistributionIndex([str(site_packages)])
+    assert len(index) == 2
+    for name in ("typing_extensions", "typing-extensions", "Typing.Extensions"):
+        assert index.get(name).metadata["Version"] == "4.12.2"
+    assert "ZOPE-INTERFACE" in index
+
+
+def test_distribution_index_missing_package(site_packages):
+    index = DistributionIndex([str(site_packages)])
+    with pytest.raises(metadata.PackageNotFoundError):
+        index.get("nonexistent")
+
+
+def test_distribution_index_first_path_entry_wins(site_packages, tmp_path_factory):
+    shadowed = tmp_path_factory.mktemp("shadowed")
+    make_dist_info(
+        shadowed, "typing_extensions-3.0.dist-info", "typing_extensions", "3.0"
+    )
+    index = DistributionIndex([str(site_packages), str(shadowed)])
+    assert index.get("typing-extensions").metadata["Version"] == "4.12.2"
+
+
+def test_distribution_index_invalidated_on_change(site_packages):
+    index = DistributionIndex([str(site_packages)])
+    assert "requests" not in index
+
+    make_dist_info(site_packages, "requests-2.32.3.dist-info", "requests", "2.32.3")
+    stat = os.stat(site_packages)
+    os.utime(site_packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert index.get("requests").metadata["Version"] == "2.32.3"
+
+
+def test_get_deps_info_from_local_with_index(site_packages):
+    index = DistributionIndex([str(site_packages)])
+    package_info = get_deps_info_from_local("TYPING-EXTENSIONS", index)
+    assert package_info.name == "typing_extensions"
+    assert package_info.local_version == "4.12.2"
+    assert package_info.license == "MIT"
+    with pytest.raises(ModuleNotFoundError):
+        get_deps_info_from_local("nonexistent", index)
+
+
+def test_get_distribution_size_cached_until_record_changes(site_packages):
+    index = DistributionIndex([str(site_packages)])
+    record = site_packages / "typing_extensions-4.12.2.dist-info" / "RECORD"
+    record.write_text("typing_extensions.py,sha256=abc,1000\nMETADATA,,24\n")
+    distribution = index.get("typing-extensions")
+    assert get_distribution_size(distribution) == 1024
+
+    stat = os.stat(record)
+    record.write_text("typing_extensions.py,sha256=abc,2000\nMETADATA,,24\n")
+    os.utime(record, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert get_distribution_size(distribution) == 1024
+
+    os.utime(record, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert get_distribution_size(distribution) == 2024
+
+
+def test_get_deps_info_from_local_without_size(site_packages):
+    index = DistributionIndex([str(site_packages)])
+    package_info = get_deps_info_from_local("typing-extensions", index, with_size=False)
+    assert package_info.size == -1
@@ -0,0 +1,126 @@
+# type:ignore
+import pytest  # type: ignore
+
+from licesenser.enums import LicenseType
+from licesenser.license_manager.get_project_license import \
+    extract_license_info_async
+from licesenser.license_manager.license_corpus import (build_license_index,
+                                                       get_license_index,
+                                                       load_license_index,
+                                                       match_license_text,
+                                                       write_license_index)
+
+MIT_TEXT = """Copyright (c) 2021 Jane Doe
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+BSD_2_CLAUSES = """Copyright (c) 2019, Example Corp.
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+"""
+
+BSD_3_CLAUSE = """
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+"""
+
+BSD_DISCLAIMER = """
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+
+@pytest.mark.parametrize(
+    "text, spdx_id",
+    [
+        (MIT_TEXT, "MIT"),
+        (BSD_2_CLAUSES + BSD_DISCLAIMER, "BSD-2-Clause"),
+        (BSD_2_CLAUSES + BSD_3_CLAUSE + BSD_DISCLAIMER, "BSD-3-Clause"),
+        ("This project is proprietary, all rights reserved.", None),
+        ("", None),
+    ],
+)
+def test_match_license_text(text: str, spdx_id: str) -> None:
+    match = match_license_text(text)
+    assert (match and match.spdx_id) == spdx_id
+
+
+def test_match_license_text_confidence() -> None:
+    assert match_license_text(MIT_TEXT).confidence > 0.95
+    partial = MIT_TEXT[: len(MIT_TEXT) // 2]
+    assert match_license_text(partial) is None
+    assert 0 < match_license_text(partial, min_confidence=0.3).confidence < 0.8
+
+
+def test_license_index_round_trip(tmp_path) -> None:
+    index = build_license_index({"MIT": MIT_TEXT})
+    write_license_index(index, str(tmp_path / "index.bin"))
+    assert load_license_index(str(tmp_path / "index.bin")) == index
+    assert match_license_text(MIT_TEXT, index).spdx_id == "MIT"
+
+
+def test_bundled_license_index() -> None:
+    index = get_license_index()
+    assert {entry.spdx_id for entry in index} >= {"MIT", "Apache-2.0", "GPL-3.0-only"}
+    assert all(entry.sample for entry in index)
+
+
+@pytest.mark.asyncio
+async def test_license_file_without_license_name(tmp_path) -> None:
+    license_file = tmp_path / "LICENSE"
+    license_file.write_text(MIT_TEXT)
+    assert await extract_license_info_async(str(license_file)) == LicenseType.MIT
+
+
+def test_match_license_text_bundled_licenses() -> None:
+    bundled = MIT_TEXT + "\n\nfoo\n\n" + BSD_2_CLAUSES + BSD_3_CLAUSE + BSD_DISCLAIMER
+    assert match_license_text(bundled) is None
+
+
+@pytest.mark.asyncio
+async def test_license_file_with_third_party_license(tmp_path) -> None:
+    license_file = tmp_path / "LICENSE"
+    license_file.write_text(
+        "MIT License\n\n"
+        + MIT_TEXT
+        + "\nThird-party licenses\n\nfoo is distributed under the following license:\n\n"
+        + BSD_2_CLAUSES
+        + BSD_3_CLAUSE
+        + BSD_DISCLAIMER
+    )
+    assert await extract_license_info_async(str(license_file)) == LicenseType.MIT
@@ -0,0 +1,67 @@
+# type:ignore
+import pytest
+
+from licesenser.enums import LicenseType
+from licesenser.license_manager.get_dependency_license import \
+    create_package_info
+from licesenser.license_manager.license_names import (get_classifier_license,
+                                                      get_license_type,
+                                                      get_spdx_id,
+                                                      normalize_license)
+
+
+@pytest.mark.parametrize(
+    "license, spdx_id, license_type",
+    [
+        ("License :: OSI Approved :: MIT License", "MIT", LicenseType.MIT),
+        (
+            "License :: OSI Approved :: GNU Lesser General Public License v3 (LGPLv3)",
+            "LGPL-3.0-only",
+            LicenseType.LGPL,
+        ),
+        ("Apache License, Version 2.0", "Apache-2.0", LicenseType.APACHE),
+        ("apache-2.0", "Apache-2.0", LicenseType.APACHE),
+        ("BSD 3-Clause License", "BSD-3-Clause", LicenseType.BSD),
+        ("GPLv3+", "GPL-3.0-or-later", LicenseType.GPL),
+        ("GNU General Public License (GPL)", None, LicenseType.GPL),
+        ("MIT LICENSE", "MIT", LicenseType.MIT),
+        ("License :: OSI Approved :: BSD License", None, LicenseType.BSD),
+        (
+            "License :: OSI Approved :: Apache Software License",
+            None,
+            LicenseType.APACHE,
+        ),
+        ("Artistic License", None, LicenseType.ARTISTIC),
+        ("BSD", None, LicenseType.BSD),
+        ("Proprietary", None, LicenseType.UNKNOWN),
+    ],
+)
+def test_identify_license_name(license, spdx_id, license_type):
+    assert get_spdx_id(license) == spdx_id
+    assert get_license_type(license) == license_type
+
+
+def test_get_classifier_license():
+    assert get_classifier_license("License :: OSI Approved :: MIT License") == (
+        "MIT License"
+    )
+    assert get_classifier_license("License :: OSI Approved") is None
+    assert get_classifier_license("License :: OSI :: MIT License") is None
+    assert get_classifier_license("Programming Language :: Python") is None
+
+
+def test_normalize_license():
+    assert normalize_license("The MIT License") == "MIT"
+    assert normalize_license("Some custom terms") == "Some custom terms"
+    assert (
+        normalize_license("MIT License\n\n" + "Permission is hereby granted " * 20)
+        != "MIT"
+    )
+    assert normalize_license(None) is None
+
+
+def test_package_info_license_ids():
+    package_info = create_package_info(
+        name="example", license="MIT License;; Apache License 2.0;; Custom"
+    )
+    assert package_info.license_ids == ("MIT", "Apache-2.0")
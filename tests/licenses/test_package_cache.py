@@ -0,0 +1,58 @@
+# type:ignore
+from unittest.mock import patch
+
+from licesenser.license_manager.get_dependency_license import (
+    create_package_info, get_project_packages)
+from licesenser.license_manager.package_cache import PackageCache
+
+
+def test_package_cache_normalized_key(tmp_path):
+    cache = PackageCache(str(tmp_path))
+    package = create_package_info(name="typing_extensions", latest_version="4.12.2")
+    cache.set("Typing.Extensions", "4.12.2", package)
+    assert cache.get("typing-extensions", "4.12.2") == package
+    assert cache.get("typing-extensions", "4.12.1") is None
+    assert cache.clear() == 1
+    assert cache.get("typing-extensions", "4.12.2") is None
+
+
+def test_package_cache_ttl(tmp_path):
+    cache = PackageCache(str(tmp_path), ttl=-1)
+    cache.set("example", "1.0.0", create_package_info(name="example"))
+    assert cache.get("example", "1.0.0") is None
+
+
+def test_get_project_packages_uses_cache(package_cache):
+    with patch(
+        "licesenser.license_manager.get_dependency_license.get_deps_info_from_pypi",
+        return_value=create_package_info(name="remote", latest_version="2.0.0"),
+    ) as pypi:
+        first = get_project_packages({"remote==2.0.0"})
+        second = get_project_packages({"remote==2.0.0"})
+        assert first == second
+        assert pypi.call_count == 1
+
+        get_project_packages({"remote==2.0.0"}, use_cache=False)
+        assert pypi.call_count == 2
+
+    assert package_cache.get("REMOTE", "2.0.0") is not None
+
+
+def test_get_project_packages_caches_missing(package_cache):
+    with patch(
+        "licesenser.license_manager.get_dependency_license.get_deps_info_from_pypi",
+        side_effect=ModuleNotFoundError,
+    ) as pypi:
+        first = get_project_packages({"missing==1.0"})
+        second = get_project_packages({"missing==1.0"})
+    assert first == second
+    assert pypi.call_count == 1
+    assert package_cache.get("missing", "1.0").error_code == 1
+
+
+def test_package_cache_negative_ttl(tmp_path):
+    cache = PackageCache(str(tmp_path), negative_ttl=-1)
+    cache.set("example", "1.0.0", create_package_info(name="example"))
+    cache.set("missing", "1.0.0", create_package_info(name="missing", error_code=1))
+    assert cache.get("example", "1.0.0") is not None
+    assert cache.get("missing", "1.0.0") is None
@@ -1,10 +1,15 @@
 # type:ignore
+import asyncio
 import os
+from unittest.mock import patch
 
+import aiofiles
 import pytest  # type: ignore
 
 from licesenser.enums import LicenseType
-from licesenser.license_manager.get_project_license import LicenseFinder
+from licesenser.license_manager.get_project_license import (
+    FileFinder, LicenseFinder, decode_text, extract_license_info_async,
+    identify_license_from_text, scan_project_roots)
 
 
 # Test functions
@@ -181,3 +186,370 @@ async def test_pyproject_toml_license_async(
         root_directory_valid
     )
     assert all_license_info.get(pyproject_toml_path) == LicenseType.MIT
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            "GNU LESSER GENERAL PUBLIC LICENSE\nVersion 3 ... the GNU General Public"
+            " License, supplemented by the additional permissions listed below.",
+            LicenseType.LGPL,
+        ),
+        (
+            "GNU AFFERO GENERAL PUBLIC LICENSE\n... GNU General Public License",
+            LicenseType.AGPL,
+        ),
+        (
+            "GNU GENERAL PUBLIC LICENSE\n... use the GNU Lesser General Public License",
+            LicenseType.GPL,
+        ),
+        ("GNU Library General\n    Public License, version 2", LicenseType.LGPL),
+        ("Licensed under the Apache\nLicense, Version 2.0", LicenseType.APACHE),
+        ("Copyright (c) none of your business", LicenseType.UNKNOWN),
+        ("x" * 1_000_000 + " MIT License", LicenseType.MIT),
+    ],
+)
+def test_identify_license_from_text(text: str, expected: LicenseType) -> None:
+    assert identify_license_from_text(text) == expected
+
+
+def test_find_files_excludes_by_directory_name(file_finder, tmp_path) -> None:
+    for directory in ("environments", "tests", "pkg/.git", "pkg/src"):
+        (tmp_path / directory).mkdir(parents=True)
+        (tmp_path / directory / "LICENSE").write_text("MIT License")
+    (tmp_path / "setup.cfg").write_text("license = MIT")
+    (tmp_path / "README.md").write_text("")
+
+    found = file_finder.find_files(str(tmp_path))
+    assert sorted(os.path.relpath(path, tmp_path) for path in found) == [
+        os.path.join("environments", "LICENSE"),
+        os.path.join("pkg", "src", "LICENSE"),
+        "setup.cfg",
+    ]
+
+
+def test_find_files_symlink_loop(tmp_path) -> None:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "LICENSE").write_text("MIT License")
+    os.symlink(tmp_path, tmp_path / "pkg" / "loop")
+
+    assert FileFinder().find_files(str(tmp_path)) == [str(tmp_path / "pkg" / "LICENSE")]
+    assert FileFinder(follow_symlinks=True).find_files(str(tmp_path)) == [
+        str(tmp_path / "pkg" / "LICENSE")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sync_entry_points_inside_running_loop(
+    license_finder: LicenseFinder, root_directory_valid: str
+) -> None:
+    all_license_info = license_finder.find_all_license_information(root_directory_valid)
+    assert all_license_info == await license_finder.find_all_license_information_async(
+        root_directory_valid
+    )
+    first_license_info = license_finder.find_first_license_information(
+        root_directory_valid
+    )
+    assert first_license_info == (
+        await license_finder.find_first_license_information_async(root_directory_valid)
+    )
+
+
+def test_sync_entry_points_use_one_event_loop(
+    license_finder: LicenseFinder, root_directory_valid: str
+) -> None:
+    with patch(
+        "licesenser.license_manager.get_project_license.asyncio.run",
+        wraps=asyncio.run,
+    ) as run:
+        all_license_info = license_finder.find_all_license_information(
+            root_directory_valid
+        )
+    assert len(all_license_info) > 1
+    assert run.call_count == 1
+
+
+def test_bounded_concurrency(
+    file_finder: FileFinder, root_directory_valid: str
+) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def extractor(file_path: str, data=None) -> LicenseType:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return LicenseType.MIT
+
+    license_finder = LicenseFinder(file_finder, max_concurrency=2)
+    license_finder.license_extractor = extractor
+    all_license_info = license_finder.find_all_license_information(root_directory_valid)
+    assert len(all_license_info) > 2
+    assert peak == 2
+
+
+def make_timed_extractor(
+    results: dict[str, tuple[float, LicenseType]], cancelled: list[str]
+):
+    async def extractor(file_path: str, data=None) -> LicenseType:
+        delay, info = results[os.path.basename(file_path)]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(os.path.basename(file_path))
+            raise
+        return info
+
+    return extractor
+
+
+@pytest.mark.asyncio
+async def test_race_prefers_license_file(
+    license_finder: LicenseFinder, root_directory_valid: str
+) -> None:
+    cancelled = []
+    license_finder.license_extractor = make_timed_extractor(
+        {
+            "license.md": (0.05, LicenseType.LGPL),
+            "license": (0.05, LicenseType.UNKNOWN),
+            "setup.cfg": (0, LicenseType.MIT),
+            "pyproject.toml": (0, LicenseType.MIT),
+        },
+        cancelled,
+    )
+    info = await license_finder.find_first_license_information_async(
+        root_directory_valid, race=True
+    )
+    assert info == LicenseType.LGPL
+    assert cancelled == []
+
+
+@pytest.mark.asyncio
+async def test_race_cancels_outstanding_reads(
+    license_finder: LicenseFinder, root_directory_valid: str
+) -> None:
+    cancelled = []
+    license_finder.license_extractor = make_timed_extractor(
+        {
+            "license.md": (0, LicenseType.MIT),
+            "license": (0, LicenseType.MIT),
+            "setup.cfg": (10, LicenseType.MIT),
+            "pyproject.toml": (10, LicenseType.MIT),
+        },
+        cancelled,
+    )
+    info = await asyncio.wait_for(
+        license_finder.find_first_license_information_async(
+            root_directory_valid, race=True
+        ),
+        timeout=5,
+    )
+    assert info == LicenseType.MIT
+    assert sorted(cancelled) == ["pyproject.toml", "setup.cfg"]
+
+
+def test_race_without_license(
+    license_finder: LicenseFinder, root_directory_invalid: str
+) -> None:
+    info = license_finder.find_first_license_information(
+        root_directory_invalid, race=True
+    )
+    assert info == LicenseType.UNKNOWN
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"MIT License", "MIT License"),
+        (b"\xef\xbb\xbfMIT License", "MIT License"),
+        ("MIT License".encode("utf-16"), "MIT License"),
+        ("Copyright \xa9 MIT License".encode("latin-1"), "Copyright \xa9 MIT License"),
+        ("MIT License \u00e9".encode()[:-1], "MIT License "),
+        (b"\x7fELF\x02\x01\x00\x00", None),
+    ],
+)
+def test_decode_text(data: bytes, expected: str) -> None:
+    assert decode_text(data) == expected
+
+
+@pytest.mark.asyncio
+async def test_license_file_encodings(tmp_path) -> None:
+    latin = tmp_path / "latin" / "LICENSE"
+    latin.parent.mkdir()
+    latin.write_bytes("Copyright \xa9 2024\nMIT License\n".encode("latin-1"))
+    binary = tmp_path / "binary" / "LICENSE"
+    binary.parent.mkdir()
+    binary.write_bytes(b"\x00\x01MIT License\x00")
+
+    assert await extract_license_info_async(str(latin)) == LicenseType.MIT
+    assert await extract_license_info_async(str(binary)) == LicenseType.UNKNOWN
+
+
+@pytest.mark.asyncio
+async def test_license_file_read_window(tmp_path) -> None:
+    license_file = tmp_path / "LICENSE"
+    license_file.write_text("x" * 1024 + "\nMIT License\n")
+
+    assert await extract_license_info_async(str(license_file)) == LicenseType.MIT
+    assert (
+        await extract_license_info_async(str(license_file), max_bytes=512)
+        == LicenseType.UNKNOWN
+    )
+    license_finder = LicenseFinder(FileFinder(), max_bytes=512)
+    assert license_finder.find_first_license_information(str(tmp_path)) == (
+        LicenseType.UNKNOWN
+    )
+
+
+def test_scan_project_roots(tmp_path) -> None:
+    roots = []
+    for name, content in [("mit", "MIT License"), ("apache", "Apache License")]:
+        root = tmp_path / name
+        root.mkdir()
+        (root / "LICENSE").write_text(content)
+        roots.append(str(root))
+    roots.append(str(tmp_path / "missing"))
+
+    results = dict(scan_project_roots(roots, max_workers=2))
+    assert results == {
+        roots[0]: {os.path.join(roots[0], "LICENSE"): LicenseType.MIT},
+        roots[1]: {os.path.join(roots[1], "LICENSE"): LicenseType.APACHE},
+        roots[2]: {},
+    }
+
+
+def test_iter_files(file_finder: FileFinder, root_directory_valid: str) -> None:
+    file_paths = file_finder.iter_files(root_directory_valid)
+    first = next(file_paths)
+    assert [first, *file_paths] == file_finder.find_files(root_directory_valid)
+
+
+def test_iter_license_information(
+    license_finder: LicenseFinder, root_directory_valid: str
+) -> None:
+    results = list(license_finder.iter_license_information(root_directory_valid))
+    assert len(results) == len(set(results))
+    assert dict(results) == license_finder.find_all_license_information(
+        root_directory_valid
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_license_information_async_streams(tmp_path) -> None:
+    for index in range(6):
+        (tmp_path / f"project{index}").mkdir()
+        (tmp_path / f"project{index}" / "LICENSE").write_text(f"MIT License {index}")
+    license_finder = LicenseFinder(FileFinder(), max_concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+    cancelled = 0
+
+    async def extractor(file_path, data=None):
+        nonlocal in_flight, max_in_flight, cancelled
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.01 if max_in_flight == 1 else 1)
+            return LicenseType.MIT
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        finally:
+            in_flight -= 1
+
+    license_finder.license_extractor = extractor
+    results = license_finder.iter_license_information_async(str(tmp_path))
+    async for file_path, info in results:
+        assert info == LicenseType.MIT
+        break
+    await results.aclose()
+    assert max_in_flight == 2
+    assert cancelled == 1
+    assert in_flight == 0
+
+
+def test_identical_license_files_classified_once(tmp_path) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "LICENSE").write_text("MIT License")
+        (tmp_path / name / "setup.cfg").write_text("license = MIT License\n")
+    (tmp_path / "d").mkdir()
+    (tmp_path / "d" / "LICENSE").write_text("Apache License")
+    license_finder = LicenseFinder(FileFinder())
+    extracted = []
+
+    async def extractor(file_path, data=None):
+        extracted.append(os.path.relpath(file_path, tmp_path))
+        await asyncio.sleep(0.01)
+        return await extract_license_info_async(file_path, data=data)
+
+    license_finder.license_extractor = extractor
+    all_license_info = license_finder.find_all_license_information(str(tmp_path))
+    assert len(all_license_info) == 7
+    assert all_license_info[str(tmp_path / "d" / "LICENSE")] == LicenseType.APACHE
+    assert len(extracted) == 3
+
+    extracted.clear()
+    assert license_finder.find_all_license_information(str(tmp_path)) == (
+        all_license_info
+    )
+    assert extracted == []
+
+    license_finder.deduplicate = False
+    license_finder.find_all_license_information(str(tmp_path))
+    assert len(extracted) == 7
+
+
+def test_license_files_read_once(tmp_path) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "LICENSE").write_text(f"MIT License {name}")
+        (tmp_path / name / "setup.cfg").write_text(f"license = BSD License\n#{name}")
+    opened = []
+    open_file = aiofiles.open
+
+    def counting_open(file_path, *args, **kwargs):
+        opened.append(file_path)
+        return open_file(file_path, *args, **kwargs)
+
+    license_finder = LicenseFinder(FileFinder())
+    with patch(
+        "licesenser.license_manager.get_project_license.aiofiles.open", counting_open
+    ):
+        all_license_info = license_finder.find_all_license_information(str(tmp_path))
+    assert len(all_license_info) == 6
+    assert sorted(opened) == sorted(all_license_info)
+
+
+def test_license_files_hashed_over_read_window(tmp_path) -> None:
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "LICENSE").write_text("MIT License\n" + "-" * 1024 + name)
+    license_finder = LicenseFinder(FileFinder(), max_bytes=512)
+    extracted = []
+
+    async def extractor(file_path, data=None):
+        extracted.append(file_path)
+        return await extract_license_info_async(file_path, 512, data)
+
+    license_finder.license_extractor = extractor
+    assert set(license_finder.find_all_license_information(str(tmp_path)).values()) == {
+        LicenseType.MIT
+    }
+    # files differing past the window share one classification
+    assert len(extracted) == 1
+
+
+def test_classification_memo_is_bounded(tmp_path) -> None:
+    for index in range(4):
+        (tmp_path / str(index)).mkdir()
+        (tmp_path / str(index) / "LICENSE").write_text(f"MIT License {index}")
+    license_finder = LicenseFinder(FileFinder())
+    with patch(
+        "licesenser.license_manager.get_project_license.CLASSIFICATION_MEMO_SIZE", 2
+    ):
+        assert len(license_finder.find_all_license_information(str(tmp_path))) == 4
+    assert len(license_finder.classifications) == 2
@@ -0,0 +1,113 @@
+# type:ignore
+from functools import partial
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from licesenser.connections import AsyncPyPIClient
+from licesenser.license_manager.get_dependency_license import (
+    get_deps_info_from_pypi_async, get_project_packages_async)
+
+mock_pypi_response = {
+    "info": {
+        "name": "example",
+        "version": "1.0.0",
+        "home_page": "https://example.com",
+        "author": "John Doe",
+        "author_email": "john.doe@example.com",
+        "license": "MIT License",
+        "classifiers": ["License :: OSI Approved :: MIT License"],
+    },
+    "urls": [{"size": 1024}],
+}
+
+
+@pytest_asyncio.fixture
+async def pypi_server():
+    hits = []
+
+    async def package(request):
+        hits.append(request.match_info["name"])
+        if request.match_info["name"] == "nonexistent":
+            return web.json_response({"message": "Not Found"}, status=404)
+        return web.json_response(mock_pypi_response)
+
+    app = web.Application()
+    app.router.add_get("/pypi/{name}/json", package)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_async_client_caches_responses(pypi_server, tmp_path):
+    url, hits = pypi_server
+    async with AsyncPyPIClient(cache_dir=str(tmp_path)) as client:
+        first = await client.get_json(f"{url}/pypi/example/json")
+        second = await client.get_json(f"{url}/pypi/example/json")
+    assert first == second == mock_pypi_response
+    assert hits == ["example"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_does_not_cache_not_found(pypi_server, tmp_path):
+    url, hits = pypi_server
+    async with AsyncPyPIClient(cache_dir=str(tmp_path)) as client:
+        await client.get_json(f"{url}/pypi/nonexistent/json")
+        await client.get_json(f"{url}/pypi/nonexistent/json")
+    assert hits == ["nonexistent", "nonexistent"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_serves_stale_on_error(tmp_path):
+    url = "http://127.0.0.1:9/pypi/example/json"
+    async with AsyncPyPIClient(cache_dir=str(tmp_path)) as client:
+        client.cache.set(url, (0, b'{"stale": true}'))
+        assert await client.get_json(url) == {"stale": True}
+
+
+@pytest.mark.asyncio
+async def test_get_deps_info_from_pypi_async():
+    client = AsyncMock()
+    client.get_json.return_value = mock_pypi_response
+    package_info = await get_deps_info_from_pypi_async("example", client)
+    assert package_info.name == "example"
+    assert package_info.latest_version == "1.0.0"
+    assert package_info.size == 1024
+    assert package_info.license == "MIT"
+
+
+@pytest.mark.asyncio
+async def test_get_deps_info_from_pypi_async_error():
+    client = AsyncMock()
+    client.get_json.side_effect = aiohttp.ClientConnectionError
+    with pytest.raises(ModuleNotFoundError):
+        await get_deps_info_from_pypi_async("example", client)
+
+
+@pytest.mark.asyncio
+async def test_get_project_packages_async_fallback(tmp_path):
+    with (
+        patch(
+            "licesenser.license_manager.get_dependency_license.AsyncPyPIClient",
+            partial(AsyncPyPIClient, cache_dir=str(tmp_path)),
+        ),
+        patch(
+            "licesenser.license_manager.get_dependency_license.get_deps_info_from_local",
+            side_effect=ModuleNotFoundError,
+        ),
+        patch(
+            "licesenser.connections.AsyncPyPIClient.get_json",
+            side_effect=aiohttp.ClientConnectionError,
+        ),
+    ):
+        package_info_set = await get_project_packages_async({"missing=1", "other=2"})
+    assert {pkg.name for pkg in package_info_set} == {"MISSING", "OTHER"}
+    assert all(pkg.error_code == 1 for pkg in package_info_set)
@@ -50,4 +50,4 @@ def test_get_deps_info_from_local(mock_metadata_distribution):
         assert package_info.author == "John Doe"
         assert package_info.author_email == "john.doe@example.com"
         assert package_info.size == 1024
-        assert package_info.license == "MIT LICENSE"
+        assert package_info.license == "MIT"
@@ -0,0 +1,94 @@
+# type:ignore
+import os
+
+from licesenser.enums import LicenseType
+from licesenser.license_manager import scan_cache
+from licesenser.license_manager.get_project_license import (
+    FileFinder, LicenseFinder, extract_license_info_async)
+from licesenser.license_manager.scan_cache import ScanCache
+
+
+def make_incremental_finder(cache_dir):
+    license_finder = LicenseFinder(FileFinder(), scan_cache=ScanCache(str(cache_dir)))
+    extracted = []
+
+    async def extractor(file_path, data=None):
+        extracted.append(os.path.basename(file_path))
+        return await extract_license_info_async(file_path, data=data)
+
+    license_finder.license_extractor = extractor
+    return license_finder, extracted
+
+
+def test_incremental_scan(tmp_path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "LICENSE").write_text("MIT License")
+    (project / "setup.cfg").write_text("[metadata]\nlicense = BSD License\n")
+    license_finder, extracted = make_incremental_finder(tmp_path / "cache")
+
+    first = license_finder.find_all_license_information(str(project))
+    assert sorted(extracted) == ["LICENSE", "setup.cfg"]
+
+    extracted.clear()
+    assert license_finder.find_all_license_information(str(project)) == first
+    assert extracted == []
+
+    (project / "LICENSE").write_text("Apache License")
+    all_license_info = license_finder.find_all_license_information(str(project))
+    assert extracted == ["LICENSE"]
+    assert all_license_info[str(project / "LICENSE")] == LicenseType.APACHE
+
+
+def test_incremental_scan_unchanged_content(tmp_path) -> None:
+    license_file = tmp_path / "LICENSE"
+    license_file.write_text("MIT License")
+    license_finder, extracted = make_incremental_finder(tmp_path / "cache")
+
+    license_finder.find_first_license_information(str(tmp_path))
+    stat = license_file.stat()
+    os.utime(license_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    extracted.clear()
+    assert license_finder.find_first_license_information(str(tmp_path)) == (
+        LicenseType.MIT
+    )
+    assert extracted == []
+
+    entry = license_finder.scan_cache.get(str(license_file), license_finder.max_bytes)
+    assert entry.mtime_ns == stat.st_mtime_ns + 10**9
+    assert license_finder.scan_cache.get(str(license_file), max_bytes=None) is None
+
+
+def test_classification_shared_across_scans(tmp_path) -> None:
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "LICENSE").write_text("MIT License")
+    license_finder, extracted = make_incremental_finder(tmp_path / "cache")
+    license_finder.find_first_license_information(str(tmp_path / "first"))
+
+    other_finder, extracted = make_incremental_finder(tmp_path / "cache")
+    assert other_finder.find_first_license_information(str(tmp_path / "second")) == (
+        LicenseType.MIT
+    )
+    assert extracted == []
+
+
+def test_scan_cache_version_invalidates(tmp_path, monkeypatch) -> None:
+    (tmp_path / "LICENSE").write_text("MIT License")
+    license_finder, extracted = make_incremental_finder(tmp_path / "cache")
+    license_finder.find_first_license_information(str(tmp_path))
+    license_finder.scan_cache.close()
+
+    monkeypatch.setattr(
+        scan_cache, "SCAN_CACHE_VERSION", scan_cache.SCAN_CACHE_VERSION + 1
+    )
+    other_finder, extracted = make_incremental_finder(tmp_path / "cache")
+    assert other_finder.find_first_license_information(str(tmp_path)) == (
+        LicenseType.MIT
+    )
+    assert extracted == ["LICENSE"]
+
+
+def test_license_finder_opens_no_cache_by_default() -> None:
+    assert not hasattr(scan_cache, "scan_cache")
+    assert LicenseFinder(FileFinder()).scan_cache is None
@@ -0,0 +1,66 @@
+# type:ignore
+import os
+
+import pytest  # type: ignore
+
+from licesenser.enums import LicenseType
+from licesenser.license_manager.watch import (DependencyDelta, LicenseDelta,
+                                              ProjectWatcher)
+
+
+@pytest.fixture(params=[False, True], ids=["polling", "inotify"])
+def watcher(request, tmp_path):
+    (tmp_path / "LICENSE").write_text("MIT License")
+    (tmp_path / "requirements.txt").write_text("requests==2.32.3\n")
+    with ProjectWatcher(
+        str(tmp_path), poll_interval=0.01, use_inotify=request.param
+    ) as watcher:
+        if request.param and watcher.inotify is None:
+            pytest.skip("inotify is not available")
+        yield watcher
+
+
+def test_initial_scan(watcher, tmp_path) -> None:
+    assert watcher.scan() == [
+        LicenseDelta(str(tmp_path / "LICENSE"), None, LicenseType.MIT),
+        DependencyDelta(
+            str(tmp_path / "requirements.txt"),
+            frozenset({"requests=2.32.3"}),
+            frozenset(),
+        ),
+    ]
+    assert watcher.check(timeout=0.05) == []
+
+
+def test_changes(watcher, tmp_path) -> None:
+    watcher.scan()
+    (tmp_path / "LICENSE").write_text("Apache License")
+    (tmp_path / "requirements.txt").write_text("requests==2.32.3\nidna==3.10\n")
+    (tmp_path / "README.md").write_text("not watched")
+
+    deltas = watcher.check(timeout=1)
+    assert deltas == [
+        LicenseDelta(str(tmp_path / "LICENSE"), LicenseType.MIT, LicenseType.APACHE),
+        DependencyDelta(
+            str(tmp_path / "requirements.txt"), frozenset({"idna=3.10"}), frozenset()
+        ),
+    ]
+
+
+def test_new_directory_and_removal(watcher, tmp_path) -> None:
+    watcher.scan()
+    os.remove(tmp_path / "LICENSE")
+    assert watcher.check(timeout=1) == [
+        LicenseDelta(str(tmp_path / "LICENSE"), LicenseType.MIT, None)
+    ]
+
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "LICENSE").write_text("MIT License")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "setup.cfg").write_text("license = BSD License\n")
+    deltas = []
+    for _ in range(10):
+        deltas += watcher.check(timeout=0.1)
+    assert deltas == [
+        LicenseDelta(str(tmp_path / "sub" / "setup.cfg"), None, LicenseType.BSD)
+    ]